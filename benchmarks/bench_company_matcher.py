@@ -0,0 +1,91 @@
+"""
+Company-mention filtering throughput on a synthetic subreddit file: the old
+per-line search term rebuild with one re.search per term, against the
+precompiled per-ticker matcher. Timings include reading and JSON-parsing each
+line, which dominates the time per line; on a 1M-line file the matcher ran
+META at about the same speed as before (~1.1x) and TSM about 2.2x faster.
+
+    python -m benchmarks.bench_company_matcher [n_lines]
+"""
+
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+from tradingagents.dataflows.reddit_utils import company_matcher, ticker_to_company
+
+WORDS = (
+    "market stock earnings growth guidance chip cloud revenue margin rally selloff "
+    "dividend buyback outlook inflation rates fed bond yield quarter forecast"
+).split()
+COMPANIES = ["Apple", "Nvidia", "Microsoft", "Meta", "Facebook", "TSMC", "Intel"]
+
+
+def write_subreddit_file(path, n_lines):
+    rng = random.Random(0)
+    with open(path, "w") as f:
+        for i in range(n_lines):
+            title = " ".join(rng.choices(WORDS, k=6))
+            selftext = " ".join(rng.choices(WORDS, k=30))
+            if rng.random() < 0.05:
+                title += " " + rng.choice(COMPANIES)
+            f.write(json.dumps({"title": title, "selftext": selftext}) + "\n")
+
+
+def legacy_match(query, title, selftext):
+    search_terms = []
+    if "OR" in ticker_to_company[query]:
+        search_terms = ticker_to_company[query].split(" OR ")
+    else:
+        search_terms = [ticker_to_company[query]]
+
+    search_terms.append(query)
+
+    for term in search_terms:
+        if re.search(term, title, re.IGNORECASE) or re.search(
+            term, selftext, re.IGNORECASE
+        ):
+            return True
+    return False
+
+
+def precompiled_match(query, title, selftext):
+    matcher = company_matcher(query)
+    return bool(matcher.search(title) or matcher.search(selftext))
+
+
+def run(path, match, query):
+    matches = 0
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        for line in f:
+            parsed_line = json.loads(line)
+            if match(query, parsed_line["title"], parsed_line["selftext"]):
+                matches += 1
+    return matches, time.perf_counter() - start
+
+
+def main():
+    n_lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as data_dir:
+        path = os.path.join(data_dir, "stocks.jsonl")
+        write_subreddit_file(path, n_lines)
+
+        for query in ("META", "TSM"):
+            legacy_matches, legacy_time = run(path, legacy_match, query)
+            matches, precompiled_time = run(path, precompiled_match, query)
+            assert matches == legacy_matches
+            print(
+                f"{query}: {n_lines} lines, {matches} mentions | "
+                f"legacy {n_lines / legacy_time:10,.0f} lines/s | "
+                f"precompiled {n_lines / precompiled_time:10,.0f} lines/s | "
+                f"{legacy_time / precompiled_time:.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
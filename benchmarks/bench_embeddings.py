@@ -0,0 +1,86 @@
+"""
+Memory lookup latency with the remote OpenAI embeddings endpoint against the
+local hashing backend: the time to embed one report-sized situation, and to
+run FinancialSituationMemory.get_memories over a memory of past situations.
+The embedding cache is cleared before every lookup, so each one embeds.
+
+    python -m benchmarks.bench_embeddings [n_lookups] [n_situations]
+
+The OpenAI backend is skipped when OPENAI_API_KEY is not set.
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+
+from tradingagents.agents.utils.embeddings import get_embedding_backend
+from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.embedding_cache import get_embedding_cache
+from tradingagents.default_config import DEFAULT_CONFIG
+
+WORDS = (
+    "market stock earnings growth guidance chip cloud revenue margin rally selloff "
+    "dividend buyback outlook inflation rates fed bond yield quarter forecast "
+    "rsi macd sma ema bollinger volume momentum volatility insider sentiment"
+).split()
+
+
+def make_situation(rng, n_words=1500):
+    """Four reports' worth of text, about the size of a real curr_situation."""
+    return " ".join(rng.choices(WORDS, k=n_words))
+
+
+def percentile(samples, q):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+def bench(backend_name, n_lookups, n_situations):
+    config = DEFAULT_CONFIG.copy()
+    config["embedding_backend"] = backend_name
+    config["memory_dir"] = None
+    set_config(config)
+
+    rng = random.Random(0)
+    memory = FinancialSituationMemory(f"bench_{backend_name}", config)
+    memory.add_situations(
+        [(make_situation(rng), f"advice {i}") for i in range(n_situations)]
+    )
+    backend = get_embedding_backend(config)
+    queries = [make_situation(rng) for _ in range(n_lookups)]
+
+    embed_times, lookup_times = [], []
+    for query in queries:
+        start = time.perf_counter()
+        backend.embed(query)
+        embed_times.append(time.perf_counter() - start)
+
+        get_embedding_cache().clear()
+        start = time.perf_counter()
+        memory.get_memories(query, n_matches=2)
+        lookup_times.append(time.perf_counter() - start)
+
+    print(
+        f"{backend.model:>24}: embed median {statistics.median(embed_times) * 1000:8.1f} ms"
+        f" p95 {percentile(embed_times, 0.95) * 1000:8.1f} ms | "
+        f"get_memories median {statistics.median(lookup_times) * 1000:8.1f} ms"
+        f" p95 {percentile(lookup_times, 0.95) * 1000:8.1f} ms"
+    )
+
+
+def main():
+    n_lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    n_situations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    bench("hashing", n_lookups, n_situations)
+    if os.getenv("OPENAI_API_KEY"):
+        bench("openai", n_lookups, n_situations)
+    else:
+        print("OPENAI_API_KEY not set, skipping the openai backend")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Time to set up the five role memories on a new memory store and answer the
+first lookup. "legacy" repeats what each FinancialSituationMemory did before
+MemoryService existed: build its own embedding backend, open its own chromadb
+client on memory_dir and create its collection. "shared" takes all five from
+one MemoryService, as TradingAgentsGraph does now. Both open the store and
+every collection up front; the first lookup is timed as well so no deferred
+work goes unmeasured.
+
+    python -m benchmarks.bench_graph_setup [repeats]
+"""
+
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+import chromadb
+from chromadb.config import Settings
+
+from tradingagents.agents.utils.embeddings import get_embedding_backend
+from tradingagents.agents.utils.memory import MEMORY_SCHEMA_VERSION, MemoryService
+from tradingagents.default_config import DEFAULT_CONFIG
+
+MEMORIES = [
+    "bull_memory",
+    "bear_memory",
+    "trader_memory",
+    "invest_judge_memory",
+    "risk_manager_memory",
+]
+
+
+def legacy_memory(name, config):
+    """The (backend, collection) the old FinancialSituationMemory(name, config) built."""
+    backend = get_embedding_backend(config)
+    chroma_client = chromadb.PersistentClient(
+        path=config["memory_dir"], settings=Settings(allow_reset=True)
+    )
+    collection_name = re.sub(r"[^A-Za-z0-9._-]", "-", f"{name}_{backend.model}")
+    collection = chroma_client.get_or_create_collection(
+        name=collection_name,
+        metadata={
+            "schema_version": MEMORY_SCHEMA_VERSION,
+            "embedding_model": backend.model,
+        },
+    )
+    assert collection.metadata["schema_version"] == MEMORY_SCHEMA_VERSION
+    return backend, collection
+
+
+def legacy_lookup(memory, situation):
+    backend, collection = memory
+    return collection.query(
+        query_embeddings=[backend.embed(situation)],
+        n_results=1,
+        include=["metadatas", "documents", "distances"],
+    )
+
+
+def setup_and_lookup(shared):
+    times = []
+    with tempfile.TemporaryDirectory() as memory_dir:
+        config = DEFAULT_CONFIG.copy()
+        config["memory_dir"] = memory_dir
+        config["embedding_backend"] = "hashing"
+        situation = "market showing increased volatility"
+
+        start = time.perf_counter()
+        if shared:
+            service = MemoryService(config)
+            memories = {name: service.memory(name) for name in MEMORIES}
+        else:
+            memories = {name: legacy_memory(name, config) for name in MEMORIES}
+        times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        if shared:
+            memories["bull_memory"].get_memories(situation, 1)
+        else:
+            legacy_lookup(memories["bull_memory"], situation)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    # warm up imports and lazily created module state
+    setup_and_lookup(shared=True)
+    setup_and_lookup(shared=False)
+
+    for shared in (False, True):
+        runs = [setup_and_lookup(shared) for _ in range(repeats)]
+        setup_time = statistics.median(run[0] for run in runs)
+        lookup_time = statistics.median(run[1] for run in runs)
+        total_time = statistics.median(run[0] + run[1] for run in runs)
+        print(
+            f"{'shared' if shared else 'legacy':>6}: construction {setup_time * 1000:8.1f} ms"
+            f" | first lookup {lookup_time * 1000:8.1f} ms"
+            f" | total {total_time * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
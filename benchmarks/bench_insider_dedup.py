@@ -0,0 +1,59 @@
+"""
+Insider transaction report on synthetic finnhub files of growing size, to check
+that deduplication scales linearly with the number of filings.
+
+    python -m benchmarks.bench_insider_dedup
+"""
+
+import json
+import os
+import random
+import tempfile
+import time
+
+import tradingagents.dataflows.interface as interface
+
+
+def write_insider_file(data_dir, n_filings, ticker="BENCH"):
+    rng = random.Random(0)
+    days = [f"2024-{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 29)]
+    data = {day: [] for day in days}
+    for i in range(n_filings):
+        day = rng.choice(days)
+        entry = {
+            "name": f"Insider {rng.randrange(50)}",
+            "share": rng.randrange(1_000, 100_000),
+            "change": rng.randrange(-5_000, 5_000),
+            "filingDate": day,
+            "transactionDate": day,
+            "transactionCode": rng.choice("SPMAG"),
+            "transactionPrice": round(rng.uniform(10, 500), 2),
+            "id": str(i),
+        }
+        data[day].append(entry)
+        if i % 10 == 0:
+            # finnhub repeats filings across days, keep some duplicates around
+            data[rng.choice(days)].append(dict(entry))
+
+    path = os.path.join(data_dir, "finnhub_data", "insider_trans")
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, f"{ticker}_data_formatted.json"), "w") as f:
+        json.dump(data, f)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as data_dir:
+        interface.DATA_DIR = data_dir
+        for n_filings in (2_500, 5_000, 10_000):
+            write_insider_file(data_dir, n_filings)
+            # first call parses the file, time the report itself
+            interface.get_finnhub_company_insider_transactions("BENCH", "2024-12-31", 366)
+
+            start = time.perf_counter()
+            interface.get_finnhub_company_insider_transactions("BENCH", "2024-12-31", 366)
+            elapsed = time.perf_counter() - start
+            print(f"{n_filings:>6} filings: {elapsed * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Load time of a 10-year daily price series: CSV parsing vs. the columnar store.
+
+    python -m benchmarks.bench_price_store
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from tradingagents.dataflows.columnar_store import (
+    columnar_path,
+    convert_price_csvs,
+    load_price_frame,
+)
+
+
+def make_price_csv(data_dir, symbol="BENCH"):
+    dates = pd.bdate_range("2015-01-01", "2025-03-25", tz="America/New_York")
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(dates))))
+    data = pd.DataFrame(
+        {
+            "Date": dates,
+            "Open": close * 0.99,
+            "High": close * 1.01,
+            "Low": close * 0.98,
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 10_000_000, len(dates)),
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        }
+    )
+    path = os.path.join(data_dir, f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv")
+    data.to_csv(path, index=False)
+    return path, len(data)
+
+
+def best_of(fn, repeat=20):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as data_dir:
+        csv_path, rows = make_price_csv(data_dir)
+
+        def load_csv():
+            data = pd.read_csv(csv_path)
+            data["Date"] = pd.to_datetime(data["Date"], utc=True)
+
+        csv_time = best_of(load_csv)
+        convert_price_csvs(data_dir)
+        assert os.path.exists(columnar_path(csv_path))
+        store_time = best_of(lambda: load_price_frame(csv_path))
+
+    print(f"{rows} daily bars")
+    print(f"read_csv + to_datetime: {csv_time * 1000:8.2f} ms")
+    print(f"columnar store:         {store_time * 1000:8.2f} ms")
+    print(f"speedup:                {csv_time / store_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 import datetime
 import typer
 from pathlib import Path
@@ -871,32 +871,34 @@ def run_analysis():
 
         # Stream the analysis
         trace = []
+        seen_messages = {}
         for chunk in graph.graph.stream(init_agent_state, **args):
+            # Analysts write to their own message channels, so collect what is
+            # new across all of them
+            new_messages = graph.propagator.get_new_messages(chunk, seen_messages)
             if len(chunk["messages"]) > 0:
-                # Get the last message from the chunk
-                last_message = chunk["messages"][-1]
-
-                # Extract message content and type
-                if hasattr(last_message, "content"):
-                    content = extract_content_string(last_message.content)  # Use the helper function
-                    msg_type = "Reasoning"
-                else:
-                    content = str(last_message)
-                    msg_type = "System"
-
-                # Add message to buffer
-                message_buffer.add_message(msg_type, content)                
-
-                # If it's a tool call, add it to tool calls
-                if hasattr(last_message, "tool_calls"):
-                    for tool_call in last_message.tool_calls:
-                        # Handle both dictionary and object tool calls
-                        if isinstance(tool_call, dict):
-                            message_buffer.add_tool_call(
-                                tool_call["name"], tool_call["args"]
-                            )
-                        else:
-                            message_buffer.add_tool_call(tool_call.name, tool_call.args)
+                for message in new_messages:
+                    # Extract message content and type
+                    if hasattr(message, "content"):
+                        content = extract_content_string(message.content)  # Use the helper function
+                        msg_type = "Reasoning"
+                    else:
+                        content = str(message)
+                        msg_type = "System"
+
+                    # Add message to buffer
+                    message_buffer.add_message(msg_type, content)
+
+                    # If it's a tool call, add it to tool calls
+                    if hasattr(message, "tool_calls"):
+                        for tool_call in message.tool_calls:
+                            # Handle both dictionary and object tool calls
+                            if isinstance(tool_call, dict):
+                                message_buffer.add_tool_call(
+                                    tool_call["name"], tool_call["args"]
+                                )
+                            else:
+                                message_buffer.add_tool_call(tool_call.name, tool_call.args)
 
                 # Update reports and agent status based on chunk content
                 # Analyst Team Reports
@@ -1129,5 +1131,65 @@ def analyze():
     run_analysis()
 
 
+@app.command()
+def batch(
+    tickers: List[str] = typer.Argument(..., help="Tickers to analyse, e.g. SPY NVDA"),
+    dates: List[str] = typer.Option(
+        [datetime.datetime.now().strftime("%Y-%m-%d")],
+        "--date",
+        "-d",
+        help="Analysis date YYYY-MM-DD; repeat to analyse several dates",
+    ),
+    analysts: List[AnalystType] = typer.Option(
+        [analyst for analyst in AnalystType],
+        "--analyst",
+        "-a",
+        help="Analysts to include; repeat for several",
+    ),
+    max_concurrency: int = typer.Option(
+        4, "--max-concurrency", "-j", min=1, help="Analyses to run at once"
+    ),
+):
+    """Analyse a watchlist non-interactively with the default configuration."""
+    for date_str in dates:
+        try:
+            datetime.datetime.strptime(date_str, "%Y-%m-%d")
+        except ValueError:
+            raise typer.BadParameter(
+                f"{date_str!r} is not a date in YYYY-MM-DD format",
+                param_hint="'--date'",
+            )
+
+    graph = TradingAgentsGraph(
+        [analyst.value for analyst in analysts], config=DEFAULT_CONFIG.copy()
+    )
+
+    with console.status(
+        f"Analysing {len(tickers) * len(dates)} runs, {max_concurrency} at a time..."
+    ):
+        result = graph.propagate_batch(tickers, dates, max_concurrency=max_concurrency)
+
+    table = Table(title="Batch Results", box=box.ROUNDED)
+    table.add_column("Ticker", style="cyan")
+    table.add_column("Date", style="cyan")
+    table.add_column("Decision", style="green")
+    table.add_column("Seconds", justify="right")
+    for run in result["runs"]:
+        decision = run["decision"] or f"[red]Error: {run['error']}[/red]"
+        table.add_row(
+            run["ticker"], run["trade_date"], decision, f"{run['seconds']:.1f}"
+        )
+    console.print(table)
+    console.print(
+        f"Wall clock {result['wall_seconds']:.1f}s for "
+        f"{result['total_run_seconds']:.1f}s of analyses "
+        f"(slowest {result['max_run_seconds']:.1f}s, {result['failed']} failed)"
+    )
+    for namespace, stats in result["cache_stats"].items():
+        console.print(
+            f"Cache {namespace}: {stats['hits']} hits, {stats['misses']} misses"
+        )
+
+
 if __name__ == "__main__":
     app()
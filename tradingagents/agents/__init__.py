@@ -1,6 +1,6 @@
-from .utils.agent_utils import Toolkit, create_msg_delete
+from .utils.agent_utils import Toolkit
 from .utils.agent_states import AgentState, InvestDebateState, RiskDebateState
-from .utils.memory import FinancialSituationMemory
+from .utils.memory import FinancialSituationMemory, MemoryService
 
 from .analysts.fundamentals_analyst import create_fundamentals_analyst
 from .analysts.market_analyst import create_market_analyst
@@ -21,9 +21,9 @@ from .trader.trader import create_trader
 
 __all__ = [
     "FinancialSituationMemory",
+    "MemoryService",
     "Toolkit",
     "AgentState",
-    "create_msg_delete",
     "InvestDebateState",
     "RiskDebateState",
     "create_bear_researcher",
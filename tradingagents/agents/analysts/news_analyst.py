@@ -1,10 +1,11 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
+from langchain_core.runnables import RunnableLambda
 
 
 def create_news_analyst(llm, toolkit):
-    def news_analyst_node(state):
+    def news_analyst_chain(state):
         current_date = state["trade_date"]
         ticker = state["company_of_interest"]
 
@@ -45,17 +46,25 @@ def create_news_analyst(llm, toolkit):
         prompt = prompt.partial(current_date=current_date)
         prompt = prompt.partial(ticker=ticker)
 
-        chain = prompt | llm.bind_tools(tools)
-        result = chain.invoke(state["messages"])
+        return prompt | llm.bind_tools(tools)
 
+    def news_analyst_update(result) -> dict:
         report = ""
 
         if len(result.tool_calls) == 0:
             report = result.content
 
         return {
-            "messages": [result],
+            "news_messages": [result],
             "news_report": report,
         }
 
-    return news_analyst_node
+    def news_analyst_node(state):
+        result = news_analyst_chain(state).invoke(state["news_messages"])
+        return news_analyst_update(result)
+
+    async def anews_analyst_node(state):
+        result = await news_analyst_chain(state).ainvoke(state["news_messages"])
+        return news_analyst_update(result)
+
+    return RunnableLambda(news_analyst_node, afunc=anews_analyst_node)
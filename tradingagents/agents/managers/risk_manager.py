@@ -1,24 +1,24 @@
 import time
 import json
+import asyncio
+from langchain_core.runnables import RunnableLambda
 
 
 def create_risk_manager(llm, memory):
-    def risk_manager_node(state) -> dict:
+    def risk_manager_situation(state) -> str:
+        market_research_report = state["market_report"]
+        sentiment_report = state["sentiment_report"]
+        news_report = state["news_report"]
+        fundamentals_report = state["news_report"]
+
+        return f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
 
-        company_name = state["company_of_interest"]
+    def risk_manager_prompt(state, past_memories) -> str:
         current_date = state["trade_date"]
 
         history = state["risk_debate_state"]["history"]
-        risk_debate_state = state["risk_debate_state"]
-        market_research_report = state["market_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["news_report"]
-        sentiment_report = state["sentiment_report"]
         trader_plan = state["investment_plan"]
 
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
-
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
             past_memory_str += rec["recommendation"] + "\n\n"
@@ -47,8 +47,10 @@ Deliverables:
 Focus on actionable insights and continuous improvement. Build on past lessons, critically evaluate all perspectives, and ensure each decision advances better outcomes.
 
 Please respond in Chinese for all your risk management decisions and portfolio management decisions."""
+        return prompt
 
-        response = llm.invoke(prompt)
+    def risk_manager_update(state, response) -> dict:
+        risk_debate_state = state["risk_debate_state"]
 
         new_risk_debate_state = {
             "judge_decision": response.content,
@@ -68,4 +70,16 @@ Please respond in Chinese for all your risk management decisions and portfolio m
             "final_trade_decision": response.content,
         }
 
-    return risk_manager_node
+    def risk_manager_node(state) -> dict:
+        past_memories = memory.get_memories(risk_manager_situation(state), n_matches=2)
+        response = llm.invoke(risk_manager_prompt(state, past_memories))
+        return risk_manager_update(state, response)
+
+    async def arisk_manager_node(state) -> dict:
+        past_memories = await asyncio.to_thread(
+            memory.get_memories, risk_manager_situation(state), n_matches=2
+        )
+        response = await llm.ainvoke(risk_manager_prompt(state, past_memories))
+        return risk_manager_update(state, response)
+
+    return RunnableLambda(risk_manager_node, afunc=arisk_manager_node)
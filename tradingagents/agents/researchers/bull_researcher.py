@@ -1,13 +1,22 @@
 from langchain_core.messages import AIMessage
 import time
 import json
+import asyncio
+from langchain_core.runnables import RunnableLambda
 
 
 def create_bull_researcher(llm, memory):
-    def bull_node(state) -> dict:
+    def bull_situation(state) -> str:
+        market_research_report = state["market_report"]
+        sentiment_report = state["sentiment_report"]
+        news_report = state["news_report"]
+        fundamentals_report = state["fundamentals_report"]
+
+        return f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
+
+    def bull_prompt(state, past_memories) -> str:
         investment_debate_state = state["investment_debate_state"]
         history = investment_debate_state.get("history", "")
-        bull_history = investment_debate_state.get("bull_history", "")
         current_date = state["trade_date"]
 
         current_response = investment_debate_state.get("current_response", "")
@@ -16,9 +25,6 @@ def create_bull_researcher(llm, memory):
         news_report = state["news_report"]
         fundamentals_report = state["fundamentals_report"]
 
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
-
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
             past_memory_str += rec["recommendation"] + "\n\n"
@@ -46,8 +52,12 @@ Use this information to deliver a compelling bull argument, refute the bear's co
 
 Please respond in Chinese for all your analysis and arguments.
 """
+        return prompt
 
-        response = llm.invoke(prompt)
+    def bull_update(state, response) -> dict:
+        investment_debate_state = state["investment_debate_state"]
+        history = investment_debate_state.get("history", "")
+        bull_history = investment_debate_state.get("bull_history", "")
 
         argument = f"Bull Analyst: {response.content}"
 
@@ -61,4 +71,16 @@ Please respond in Chinese for all your analysis and arguments.
 
         return {"investment_debate_state": new_investment_debate_state}
 
-    return bull_node
+    def bull_node(state) -> dict:
+        past_memories = memory.get_memories(bull_situation(state), n_matches=2)
+        response = llm.invoke(bull_prompt(state, past_memories))
+        return bull_update(state, response)
+
+    async def abull_node(state) -> dict:
+        past_memories = await asyncio.to_thread(
+            memory.get_memories, bull_situation(state), n_matches=2
+        )
+        response = await llm.ainvoke(bull_prompt(state, past_memories))
+        return bull_update(state, response)
+
+    return RunnableLambda(bull_node, afunc=abull_node)
@@ -1,13 +1,13 @@
 from langchain_core.messages import AIMessage
 import time
 import json
+from langchain_core.runnables import RunnableLambda
 
 
 def create_safe_debator(llm):
-    def safe_node(state) -> dict:
+    def safe_prompt(state) -> str:
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
-        safe_history = risk_debate_state.get("safe_history", "")
         current_date = state["trade_date"]
 
         current_risky_response = risk_debate_state.get("current_risky_response", "")
@@ -37,8 +37,12 @@ Here is the current conversation history: {history} Here is the last response fr
 Engage by questioning their optimism and emphasizing the potential downsides they may have overlooked. Address each of their counterpoints to showcase why a conservative stance is ultimately the safest path for the firm's assets. Focus on debating and critiquing their arguments to demonstrate the strength of a low-risk strategy over their approaches. Output conversationally as if you are speaking without any special formatting.
 
 Please respond in Chinese for all your risk analysis and arguments."""
+        return prompt
 
-        response = llm.invoke(prompt)
+    def safe_update(state, response) -> dict:
+        risk_debate_state = state["risk_debate_state"]
+        history = risk_debate_state.get("history", "")
+        safe_history = risk_debate_state.get("safe_history", "")
 
         argument = f"Safe Analyst: {response.content}"
 
@@ -60,4 +64,11 @@ Please respond in Chinese for all your risk analysis and arguments."""
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return safe_node
+    def safe_node(state) -> dict:
+        return safe_update(state, llm.invoke(safe_prompt(state)))
+
+    async def asafe_node(state) -> dict:
+        response = await llm.ainvoke(safe_prompt(state))
+        return safe_update(state, response)
+
+    return RunnableLambda(safe_node, afunc=asafe_node)
@@ -1,12 +1,12 @@
 import time
 import json
+from langchain_core.runnables import RunnableLambda
 
 
 def create_neutral_debator(llm):
-    def neutral_node(state) -> dict:
+    def neutral_prompt(state) -> str:
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
-        neutral_history = risk_debate_state.get("neutral_history", "")
         current_date = state["trade_date"]
 
         current_risky_response = risk_debate_state.get("current_risky_response", "")
@@ -36,8 +36,12 @@ Here is the current conversation history: {history} Here is the last response fr
 Engage actively by analyzing both sides critically, addressing weaknesses in the risky and conservative arguments to advocate for a more balanced approach. Challenge each of their points to illustrate why a moderate risk strategy might offer the best of both worlds, providing growth potential while safeguarding against extreme volatility. Focus on debating rather than simply presenting data, aiming to show that a balanced view can lead to the most reliable outcomes. Output conversationally as if you are speaking without any special formatting.
 
 Please respond in Chinese for all your risk analysis and arguments."""
+        return prompt
 
-        response = llm.invoke(prompt)
+    def neutral_update(state, response) -> dict:
+        risk_debate_state = state["risk_debate_state"]
+        history = risk_debate_state.get("history", "")
+        neutral_history = risk_debate_state.get("neutral_history", "")
 
         argument = f"Neutral Analyst: {response.content}"
 
@@ -57,4 +61,11 @@ Please respond in Chinese for all your risk analysis and arguments."""
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return neutral_node
+    def neutral_node(state) -> dict:
+        return neutral_update(state, llm.invoke(neutral_prompt(state)))
+
+    async def aneutral_node(state) -> dict:
+        response = await llm.ainvoke(neutral_prompt(state))
+        return neutral_update(state, response)
+
+    return RunnableLambda(neutral_node, afunc=aneutral_node)
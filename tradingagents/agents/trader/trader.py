@@ -1,20 +1,23 @@
 import functools
 import time
 import json
+import asyncio
+from langchain_core.runnables import RunnableLambda
 
 
 def create_trader(llm, memory):
-    def trader_node(state, name):
-        company_name = state["company_of_interest"]
-        current_date = state["trade_date"]
-        investment_plan = state["investment_plan"]
+    def trader_situation(state) -> str:
         market_research_report = state["market_report"]
         sentiment_report = state["sentiment_report"]
         news_report = state["news_report"]
         fundamentals_report = state["fundamentals_report"]
 
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        return f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
+
+    def trader_messages(state, past_memories) -> list:
+        company_name = state["company_of_interest"]
+        current_date = state["trade_date"]
+        investment_plan = state["investment_plan"]
 
         past_memory_str = ""
         if past_memories:
@@ -39,13 +42,29 @@ Please respond in Chinese for all your trading decisions and analysis.""",
             },
             context,
         ]
+        return messages
 
-        result = llm.invoke(messages)
-
+    def trader_update(result, name) -> dict:
         return {
             "messages": [result],
             "trader_investment_plan": result.content,
             "sender": name,
         }
 
-    return functools.partial(trader_node, name="Trader")
+    def trader_node(state, name):
+        past_memories = memory.get_memories(trader_situation(state), n_matches=2)
+        result = llm.invoke(trader_messages(state, past_memories))
+        return trader_update(result, name)
+
+    async def atrader_node(state, name):
+        past_memories = await asyncio.to_thread(
+            memory.get_memories, trader_situation(state), n_matches=2
+        )
+        result = await llm.ainvoke(trader_messages(state, past_memories))
+        return trader_update(result, name)
+
+    return RunnableLambda(
+        functools.partial(trader_node, name="Trader"),
+        afunc=functools.partial(atrader_node, name="Trader"),
+        name="trader_node",
+    )
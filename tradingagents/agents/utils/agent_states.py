@@ -5,6 +5,17 @@ from langchain_openai import ChatOpenAI
 from tradingagents.agents import *
 from langgraph.prebuilt import ToolNode
 from langgraph.graph import END, StateGraph, START, MessagesState
+from langchain_core.messages import AnyMessage
+from langgraph.graph.message import add_messages
+
+
+# Message channel of each analyst's tool-calling loop
+ANALYST_MESSAGE_KEYS = {
+    "market": "market_messages",
+    "social": "social_messages",
+    "news": "news_messages",
+    "fundamentals": "fundamentals_messages",
+}
 
 
 # Researcher team state
@@ -53,6 +64,12 @@ class AgentState(MessagesState):
 
     sender: Annotated[str, "Agent that sent this message"]
 
+    # analysts' own message channels, so their tool loops can interleave
+    market_messages: Annotated[Sequence[AnyMessage], add_messages]
+    social_messages: Annotated[Sequence[AnyMessage], add_messages]
+    news_messages: Annotated[Sequence[AnyMessage], add_messages]
+    fundamentals_messages: Annotated[Sequence[AnyMessage], add_messages]
+
     # research step
     market_report: Annotated[str, "Report from the Market Analyst"]
     sentiment_report: Annotated[str, "Report from the Social Media Analyst"]
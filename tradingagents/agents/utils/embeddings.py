@@ -0,0 +1,157 @@
+import math
+import os
+import re
+import zlib
+from abc import ABC, abstractmethod
+from typing import Annotated, List, Sequence, Tuple
+
+import numpy as np
+
+from tradingagents.dataflows.openai_clients import get_openai_client
+
+
+class EmbeddingBackend(ABC):
+    """
+    Turns texts into embedding vectors for FinancialSituationMemory.
+
+    `model` names the embedding space: memories and cached embeddings are kept
+    per model, so two backends must only share a name if their vectors can be
+    compared.
+    """
+
+    model: str
+
+    @abstractmethod
+    def embed(self, text: str) -> List[float]:
+        """Embedding of a single text"""
+
+    def embed_many(self, texts: Sequence[str]) -> List[List[float]]:
+        """Embeddings of many texts, in order"""
+        return [self.embed(text) for text in texts]
+
+
+class OpenAIEmbeddingBackend(EmbeddingBackend):
+    """Embeddings from an OpenAI-compatible endpoint (OpenAI or a local Ollama)."""
+
+    def __init__(
+        self,
+        model: Annotated[str, "embedding model name"],
+        client,
+        batch_size: Annotated[int, "most texts per request"],
+        batch_max_tokens: Annotated[int, "most tokens per request"],
+    ):
+        self.model = model
+        self.client = client
+        self.batch_size = batch_size
+        self.batch_max_tokens = batch_max_tokens
+
+    def embed(self, text):
+        response = self.client.embeddings.create(model=self.model, input=text)
+        return response.data[0].embedding
+
+    def embed_many(self, texts):
+        """Embed texts in as few requests as the batch limits allow"""
+        embeddings = []
+        for batch in self._batches(texts):
+            response = self.client.embeddings.create(model=self.model, input=batch)
+            data = sorted(response.data, key=lambda item: item.index)
+            embeddings.extend(item.embedding for item in data)
+        return embeddings
+
+    def _batches(self, texts):
+        """
+        Split texts into batches of at most batch_size texts and batch_max_tokens
+        tokens. A text's UTF-8 length bounds its token count for any BPE
+        tokenizer, so it is used instead of tokenizing.
+        """
+        batch, batch_tokens = [], 0
+        for text in texts:
+            tokens = len(text.encode("utf-8"))
+            if batch and (
+                len(batch) >= self.batch_size
+                or batch_tokens + tokens > self.batch_max_tokens
+            ):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            yield batch
+
+
+class HashingEmbeddingBackend(EmbeddingBackend):
+    """
+    Local CPU embeddings: character n-grams hashed into a fixed number of
+    dimensions, log-scaled counts with a hash-derived sign, L2-normalized.
+
+    Needs no network or model files, so memories work offline, and since
+    character n-grams need no tokenizer it handles the Chinese reports as well
+    as English. It matches on shared wording, not meaning, which is coarser
+    than a learned model but enough to retrieve past situations about the same
+    company, indicators and news.
+    """
+
+    def __init__(
+        self,
+        dimensions: Annotated[int, "length of the embedding vectors"] = 1024,
+        ngram_range: Annotated[Tuple[int, int], "shortest and longest n-gram"] = (2, 4),
+    ):
+        self.dimensions = dimensions
+        self.ngram_range = tuple(ngram_range)
+        low, high = self.ngram_range
+        self.model = f"hashing-{dimensions}-{low}-{high}"
+
+    def embed(self, text):
+        text = re.sub(r"\s+", " ", text.lower()).strip()
+        low, high = self.ngram_range
+        # crc32 rather than hash(), which is salted per process
+        hashes = np.fromiter(
+            (
+                zlib.crc32(text[i : i + n].encode("utf-8"))
+                for n in range(low, high + 1)
+                for i in range(len(text) - n + 1)
+            ),
+            dtype=np.int64,
+        )
+        if hashes.size == 0:
+            return [0.0] * self.dimensions
+        signs = np.where(hashes & (1 << 31), -1.0, 1.0)
+        counts = np.bincount(
+            hashes % self.dimensions, weights=signs, minlength=self.dimensions
+        )
+        vector = np.sign(counts) * np.log1p(np.abs(counts))
+        norm = math.sqrt(float(vector @ vector))
+        if norm:
+            vector /= norm
+        return vector.tolist()
+
+
+def get_embedding_backend(config) -> EmbeddingBackend:
+    """
+    The embedding backend selected by config["embedding_backend"]: "openai" for
+    the OpenAI (or, with a local Ollama backend_url, Ollama) embeddings endpoint,
+    "hashing" for the local HashingEmbeddingBackend.
+    """
+    backend = config["embedding_backend"].lower()
+    if backend == "hashing":
+        return HashingEmbeddingBackend(
+            config["hashing_embedding_dimensions"],
+            config["hashing_embedding_ngram_range"],
+        )
+    if backend != "openai":
+        raise ValueError(f"Unsupported embedding backend: {config['embedding_backend']}")
+
+    if config["backend_url"] == "http://localhost:11434/v1":
+        # Use Ollama for embeddings when using local Ollama
+        model = "nomic-embed-text"
+        client = get_openai_client(base_url=config["backend_url"])
+    else:
+        # Always use OpenAI for embeddings (other providers don't support embedding endpoints)
+        model = "text-embedding-3-small"
+        client = get_openai_client(api_key=os.getenv("OPENAI_API_KEY"))
+    return OpenAIEmbeddingBackend(
+        model,
+        client,
+        config["embedding_batch_size"],
+        config["embedding_batch_max_tokens"],
+    )
@@ -1,29 +1,99 @@
-import os
+import re
+import threading
 import chromadb
 from chromadb.config import Settings
-from openai import OpenAI
+from tradingagents.dataflows.embedding_cache import get_embedding_cache
+from .embeddings import get_embedding_backend
+
+# Bump when the layout of stored situations changes; older stores must be migrated
+MEMORY_SCHEMA_VERSION = 1
+
+
+class MemoryService:
+    def __init__(self, config):
+        """
+        One vector store and one embedding backend, shared by the memories of
+        every role; each role's memory is a view on its own collection.
+
+        With config["memory_dir"] set, the store is persisted there and reopened
+        by later runs, so reflections accumulate across runs; with it None the
+        memories only live as long as the process. config["embedding_backend"]
+        selects the embedding model, see get_embedding_backend.
+
+        The store is opened here, and each role's collection when its memory
+        is created, so a bad memory_dir or an outdated schema fails at graph
+        construction rather than after the analysts have run.
+        """
+        self.config = config
+        self.backend = get_embedding_backend(config)
+
+        if config["memory_dir"]:
+            self.chroma_client = chromadb.PersistentClient(
+                path=config["memory_dir"], settings=Settings(allow_reset=True)
+            )
+        else:
+            self.chroma_client = chromadb.Client(Settings(allow_reset=True))
+
+        self._memories = {}
+        self._lock = threading.Lock()
+
+    def memory(self, name) -> "FinancialSituationMemory":
+        """The memory of a role, e.g. "bull_memory", created on first use"""
+        with self._lock:
+            if name not in self._memories:
+                self._memories[name] = FinancialSituationMemory(
+                    name, self.config, service=self
+                )
+            return self._memories[name]
+
+    def open_collection(self, name):
+        """
+        Open (or create) the collection of a role's memory. Lessons are kept per
+        embedding model, since embeddings from different models can't be compared.
+        """
+        # chromadb collection names only allow letters, digits, ".", "_" and "-"
+        collection_name = re.sub(
+            r"[^A-Za-z0-9._-]", "-", f"{name}_{self.backend.model}"
+        )
+        collection = self.chroma_client.get_or_create_collection(
+            name=collection_name,
+            metadata={
+                "schema_version": MEMORY_SCHEMA_VERSION,
+                "embedding_model": self.backend.model,
+            },
+        )
+        schema_version = (collection.metadata or {}).get("schema_version")
+        if schema_version != MEMORY_SCHEMA_VERSION:
+            raise ValueError(
+                f"Memory collection {collection_name} in {self.config['memory_dir']} has "
+                f"schema version {schema_version}, expected {MEMORY_SCHEMA_VERSION}"
+            )
+        return collection
 
 
 class FinancialSituationMemory:
-    def __init__(self, name, config):
-        if config["backend_url"] == "http://localhost:11434/v1":
-            self.embedding = "nomic-embed-text"
-            # Use Ollama for embeddings when using local Ollama
-            self.client = OpenAI(base_url=config["backend_url"])
-        else:
-            self.embedding = "text-embedding-3-small"
-            # Always use OpenAI for embeddings (other providers don't support embedding endpoints)
-            self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.chroma_client = chromadb.Client(Settings(allow_reset=True))
-        self.situation_collection = self.chroma_client.create_collection(name=name)
+    def __init__(self, name, config, service=None):
+        """
+        Memory of past situations and lessons of one role, stored in a chromadb
+        collection of `service`'s vector store. Without a service, the memory
+        gets a MemoryService of its own.
+        """
+        self.name = name
+        self.service = service or MemoryService(config)
+        self.backend = self.service.backend
+        self.embedding = self.backend.model
+        self.chroma_client = self.service.chroma_client
+        self.situation_collection = self.service.open_collection(name)
 
     def get_embedding(self, text):
-        """Get OpenAI embedding for a text"""
-        
-        response = self.client.embeddings.create(
-            model=self.embedding, input=text
+        """Get the embedding of a text, from the shared embedding cache if possible"""
+        return get_embedding_cache().get(self.embedding, text, self.backend.embed)
+
+    def get_embeddings(self, texts):
+        """Get embeddings for many texts, requesting only those not already cached"""
+        return get_embedding_cache().get_many(
+            self.embedding, texts, self.backend.embed_many
         )
-        return response.data[0].embedding
 
     def add_situations(self, situations_and_advice):
         """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
@@ -31,7 +101,6 @@ class FinancialSituationMemory:
         situations = []
         advice = []
         ids = []
-        embeddings = []
 
         offset = self.situation_collection.count()
 
@@ -39,7 +108,8 @@ class FinancialSituationMemory:
             situations.append(situation)
             advice.append(recommendation)
             ids.append(str(offset + i))
-            embeddings.append(self.get_embedding(situation))
+
+        embeddings = self.get_embeddings(situations)
 
         self.situation_collection.add(
             documents=situations,
@@ -49,7 +119,7 @@ class FinancialSituationMemory:
         )
 
     def get_memories(self, current_situation, n_matches=1):
-        """Find matching recommendations using OpenAI embeddings"""
+        """Find matching recommendations by embedding similarity"""
         query_embedding = self.get_embedding(current_situation)
 
         results = self.situation_collection.query(
@@ -1,8 +1,22 @@
-from .finnhub_utils import get_data_in_range
+from .finnhub_utils import FinnhubDataStore, get_data_in_range
 from .googlenews_utils import getNewsData
+from .http_session import get_http_session, get_http_session_stats
+from .openai_clients import get_openai_client, close_openai_clients
 from .yfin_utils import YFinanceUtils
-from .reddit_utils import fetch_top_from_category
+from .reddit_utils import (
+    fetch_top_from_category,
+    fetch_top_from_category_range,
+    build_reddit_index,
+)
 from .stockstats_utils import StockstatsUtils
+from .price_cache import PriceFrameCache, get_price_cache
+from .result_cache import (
+    ResultCache,
+    get_result_cache,
+    get_cache_stats,
+    cache_stats_delta,
+)
+from .embedding_cache import EmbeddingCache, get_embedding_cache
 from .yfin_utils import YFinanceUtils
 
 from .interface import (
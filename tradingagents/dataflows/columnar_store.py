@@ -0,0 +1,97 @@
+"""
+Columnar on-disk store for price data.
+
+Price CSVs are stored next to an Arrow IPC (Feather v2) copy with the same name
+and a .feather extension. The copy keeps "Date" as a typed datetime column and is
+written uncompressed so it can be memory-mapped, which makes loading a 10-year
+daily series much cheaper than parsing the CSV and its dates again on every call.
+
+Convert an existing directory of CSVs once with:
+    python -m tradingagents.dataflows.columnar_store <price_data_dir>
+"""
+
+import os
+import sys
+from typing import Annotated, List
+
+import pandas as pd
+
+import pyarrow.feather as feather
+
+COLUMNAR_EXT = ".feather"
+
+
+def columnar_path(csv_path: Annotated[str, "path of the price CSV"]) -> str:
+    """Path of the columnar copy of `csv_path`."""
+    return os.path.splitext(csv_path)[0] + COLUMNAR_EXT
+
+
+def normalize_price_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Give the "Date" column a datetime dtype.
+
+    Dates keep their exchange-local wall time, any UTC offset (as written by
+    yf.Ticker.history) is dropped, so the calendar day of a bar never shifts.
+    """
+    if "Date" not in data.columns:
+        return data
+    dates = data["Date"]
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        data["Date"] = dates.dt.tz_localize(None)
+    elif not pd.api.types.is_datetime64_any_dtype(dates):
+        data["Date"] = pd.to_datetime(dates.astype(str).str[:19])
+    return data
+
+
+def load_price_frame(csv_path: Annotated[str, "path of the price CSV"]) -> pd.DataFrame:
+    """
+    Load a price file, preferring its columnar copy.
+
+    The CSV is only parsed when there is no columnar copy or the copy is older
+    than the CSV. Raises FileNotFoundError when neither file exists.
+    """
+    store_path = columnar_path(csv_path)
+    if os.path.exists(store_path):
+        if not os.path.exists(csv_path) or os.path.getmtime(
+            store_path
+        ) >= os.path.getmtime(csv_path):
+            return feather.read_table(store_path, memory_map=True).to_pandas()
+
+    return normalize_price_frame(pd.read_csv(csv_path))
+
+
+def save_price_frame(
+    data: pd.DataFrame,
+    csv_path: Annotated[str, "path of the price CSV the frame belongs to"],
+):
+    """Write a price frame to the columnar store."""
+    data = normalize_price_frame(data.reset_index(drop=True))
+    feather.write_feather(data, columnar_path(csv_path), compression="uncompressed")
+
+
+def convert_price_csvs(
+    data_dir: Annotated[str, "directory holding the {symbol}-YFin-data-*.csv files"],
+    overwrite: Annotated[bool, "rewrite columnar copies that are up to date"] = False,
+) -> List[str]:
+    """One-shot conversion of every price CSV in `data_dir`. Returns the files written."""
+    written = []
+    for file_name in sorted(os.listdir(data_dir)):
+        if not file_name.endswith(".csv"):
+            continue
+        csv_path = os.path.join(data_dir, file_name)
+        store_path = columnar_path(csv_path)
+        if (
+            not overwrite
+            and os.path.exists(store_path)
+            and os.path.getmtime(store_path) >= os.path.getmtime(csv_path)
+        ):
+            continue
+        save_price_frame(pd.read_csv(csv_path), csv_path)
+        written.append(store_path)
+
+    return written
+
+
+if __name__ == "__main__":
+    for path in convert_price_csvs(sys.argv[1]):
+        print(f"Wrote {path}")
@@ -0,0 +1,180 @@
+"""
+Process-wide cache of text embeddings, shared by every FinancialSituationMemory.
+
+The agents of one run query their memories with the same situation text, so
+embeddings are keyed by (model, sha256 of the text) and kept in an in-memory
+LRU. Optionally they are also stored in the SQLite result cache, so reruns over
+the same reports skip the embedding requests as well.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Annotated, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .config import get_config
+from .result_cache import ResultCache, get_result_cache, make_cache_key
+
+# (model, sha256 of the text)
+EmbeddingKey = Tuple[str, str]
+Embedding = List[float]
+
+
+def make_embedding_key(model: str, text: str) -> EmbeddingKey:
+    return model, hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """In-memory LRU of embeddings, backed by an optional on-disk result cache."""
+
+    def __init__(
+        self,
+        max_entries: Annotated[int, "embeddings kept in memory"],
+        disk: Annotated[Optional[ResultCache], "on-disk tier, None for memory only"] = None,
+    ):
+        self.max_entries = max_entries
+        self.disk = disk
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._embeddings: "OrderedDict[EmbeddingKey, Embedding]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[EmbeddingKey, threading.Lock] = {}
+
+    def get(
+        self,
+        model: Annotated[str, "embedding model"],
+        text: Annotated[str, "text to embed"],
+        embed: Annotated[Callable[[str], Embedding], "embeds the text on a miss"],
+    ) -> Embedding:
+        """Return the embedding of `text` under `model`, embedding it on a miss."""
+        key = make_embedding_key(model, text)
+        embedding = self._lookup(key)
+        if embedding is not None:
+            return embedding
+
+        # only one thread embeds a given text, the others wait and then hit
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                embedding = self._lookup(key)
+                if embedding is None:
+                    embedding = self._load(key)
+                if embedding is None:
+                    embedding = embed(text)
+                    self._save(key, embedding)
+        finally:
+            with self._lock:
+                self._key_locks.pop(key, None)
+        return embedding
+
+    def get_many(
+        self,
+        model: Annotated[str, "embedding model"],
+        texts: Annotated[Sequence[str], "texts to embed"],
+        embed_many: Annotated[
+            Callable[[List[str]], List[Embedding]],
+            "embeds the missing texts, in one call",
+        ],
+    ) -> List[Embedding]:
+        """Return the embeddings of `texts`, embedding all missing ones in one call."""
+        keys = [make_embedding_key(model, text) for text in texts]
+        embeddings: Dict[EmbeddingKey, Embedding] = {}
+        missing: Dict[EmbeddingKey, str] = {}
+        for key, text in zip(keys, texts):
+            if key in embeddings or key in missing:
+                continue
+            embedding = self._lookup(key)
+            if embedding is None:
+                embedding = self._load(key)
+            if embedding is None:
+                missing[key] = text
+            else:
+                embeddings[key] = embedding
+
+        if missing:
+            for key, embedding in zip(missing, embed_many(list(missing.values()))):
+                self._save(key, embedding)
+                embeddings[key] = embedding
+        return [embeddings[key] for key in keys]
+
+    def clear(self):
+        """Drop the in-memory embeddings; the disk tier is kept."""
+        with self._lock:
+            self._embeddings.clear()
+
+    def set_max_entries(self, max_entries: int):
+        """Change the in-memory capacity, evicting embeddings if now over it."""
+        with self._lock:
+            self.max_entries = max_entries
+            self._evict()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._embeddings),
+                "max_entries": self.max_entries,
+            }
+
+    def _lookup(self, key):
+        with self._lock:
+            embedding = self._embeddings.get(key)
+            if embedding is not None:
+                self._embeddings.move_to_end(key)
+                self.hits += 1
+            return embedding
+
+    def _load(self, key):
+        """The embedding stored on disk, promoted into memory; counts a miss if absent."""
+        embedding = self.disk.get(make_cache_key(*key)) if self.disk else None
+        with self._lock:
+            if embedding is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+        self._remember(key, embedding)
+        return embedding
+
+    def _save(self, key, embedding):
+        if self.disk:
+            self.disk.set(make_cache_key(*key), embedding)
+        self._remember(key, embedding)
+
+    def _remember(self, key, embedding):
+        with self._lock:
+            self._embeddings[key] = embedding
+            self._embeddings.move_to_end(key)
+            self._evict()
+
+    def _evict(self):
+        while len(self._embeddings) > self.max_entries:
+            self._embeddings.popitem(last=False)
+            self.evictions += 1
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """
+    Get the shared embedding cache, sized by the `embedding_cache_size` config and
+    backed by the result cache file when `embedding_cache_persist` is set.
+    """
+    global _embedding_cache
+    config = get_config()
+    max_entries = config["embedding_cache_size"]
+    disk = get_result_cache("embeddings") if config["embedding_cache_persist"] else None
+    with _embedding_cache_lock:
+        if _embedding_cache is None:
+            _embedding_cache = EmbeddingCache(max_entries, disk)
+        _embedding_cache.disk = disk
+    if _embedding_cache.max_entries != max_entries:
+        _embedding_cache.set_max_entries(max_entries)
+    return _embedding_cache
@@ -1,5 +1,78 @@
 import json
 import os
+import threading
+from bisect import bisect_left, bisect_right
+
+
+class FinnhubDataStore:
+    """
+    Reads the finnhub data saved and processed on disk.
+
+    Every {ticker}_data_formatted.json is parsed once per process (and again only
+    if the file changes); its date keys are kept sorted so date range queries
+    are answered by bisection instead of scanning every key.
+    """
+
+    _files = {}  # path -> (mtime, data, sorted keys, position of each sorted key)
+    _lock = threading.Lock()
+
+    def __init__(self, data_dir):
+        """
+        Args:
+            data_dir (str): Directory where the data is saved.
+        """
+        self.data_dir = data_dir
+
+    def get_data_in_range(self, ticker, start_date, end_date, data_type, period=None):
+        """
+        Gets finnhub data with date keys in [start_date, end_date], in file order.
+        Args:
+            start_date (str): Start date in YYYY-MM-DD format.
+            end_date (str): End date in YYYY-MM-DD format.
+            data_type (str): Type of data from finnhub to fetch. Can be insider_trans, SEC_filings, news_data, insider_senti, or fin_as_reported.
+            period (str): Default to none, if there is a period specified, should be annual or quarterly.
+        """
+        data, keys, positions = self._load(self.data_path(ticker, data_type, period))
+
+        lo = bisect_left(keys, start_date)
+        hi = bisect_right(keys, end_date)
+
+        filtered_data = {}
+        for position in sorted(positions[lo:hi]):
+            key, value = data[position]
+            if len(value) > 0:
+                filtered_data[key] = value
+        return filtered_data
+
+    def data_path(self, ticker, data_type, period=None):
+        if period:
+            return os.path.join(
+                self.data_dir,
+                "finnhub_data",
+                data_type,
+                f"{ticker}_{period}_data_formatted.json",
+            )
+        return os.path.join(
+            self.data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
+        )
+
+    @classmethod
+    def _load(cls, data_path):
+        mtime = os.path.getmtime(data_path)
+        with cls._lock:
+            cached = cls._files.get(data_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1:]
+
+        with open(data_path, "r") as f:
+            data = list(json.load(f).items())
+
+        order = sorted(range(len(data)), key=lambda i: data[i][0])
+        keys = [data[i][0] for i in order]
+
+        with cls._lock:
+            cls._files[data_path] = (mtime, data, keys, order)
+        return data, keys, order
 
 
 def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
@@ -12,25 +85,6 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
         data_dir (str): Directory where the data is saved.
         period (str): Default to none, if there is a period specified, should be annual or quarterly.
     """
-
-    if period:
-        data_path = os.path.join(
-            data_dir,
-            "finnhub_data",
-            data_type,
-            f"{ticker}_{period}_data_formatted.json",
-        )
-    else:
-        data_path = os.path.join(
-            data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
-        )
-
-    data = open(data_path, "r")
-    data = json.load(data)
-
-    # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
-    filtered_data = {}
-    for key, value in data.items():
-        if start_date <= key <= end_date and len(value) > 0:
-            filtered_data[key] = value
-    return filtered_data
+    return FinnhubDataStore(data_dir).get_data_in_range(
+        ticker, start_date, end_date, data_type, period
+    )
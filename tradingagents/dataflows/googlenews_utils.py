@@ -1,9 +1,8 @@
 import json
-import requests
 from bs4 import BeautifulSoup
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import time
-import random
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -12,31 +11,126 @@ from tenacity import (
     retry_if_result,
 )
 
+from .config import get_config
+from .http_session import get_http_session
+from .rate_limit import get_rate_limiter
+
+GOOGLE_SEARCH_URL = "https://www.google.com/search"
+RESULTS_PER_PAGE = 10
+# Longest Retry-After we honour, so one response can't stall every thread for long
+MAX_RETRY_AFTER = 60
+
 
 def is_rate_limited(response):
     """Check if the response indicates rate limiting (status code 429)"""
-    return response.status_code == 429
+    return response is not None and response.status_code == 429
+
+
+def google_news_rate_limiter():
+    """The process-wide token bucket all Google News requests go through"""
+    config = get_config()
+    return get_rate_limiter(
+        "google_news",
+        config["google_news_requests_per_second"],
+        config["google_news_burst"],
+    )
+
+
+def wait_retry_after(retry_state):
+    """
+    Wait as long as a 429 response's Retry-After header asks, up to
+    MAX_RETRY_AFTER seconds, exponentially otherwise
+    """
+    response = retry_state.outcome.result()
+    try:
+        retry_after = float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return wait_exponential(multiplier=1, min=4, max=MAX_RETRY_AFTER)(retry_state)
+    retry_after = min(max(retry_after, 0.0), MAX_RETRY_AFTER)
+
+    # back off every thread sharing the limiter, not just this one
+    google_news_rate_limiter().pause(retry_after)
+    return retry_after
 
 
 @retry(
     retry=(retry_if_result(is_rate_limited)),
-    wait=wait_exponential(multiplier=1, min=4, max=60),
+    wait=wait_retry_after,
     stop=stop_after_attempt(5),
 )
-def make_request(url, headers):
-    """Make a request with retry logic for rate limiting"""
-    # Random delay before each request to avoid detection
-    time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
+def make_request(url, headers, cancelled=None):
+    """
+    Make a request with retry logic for rate limiting. Returns None without
+    requesting if `cancelled()` is true once the rate limiter lets it through.
+    """
+    # Requests are paced by the shared rate limiter instead of a random sleep
+    google_news_rate_limiter().acquire()
+    if cancelled is not None and cancelled():
+        return None
+    response = get_http_session("google_news").get(url, headers=headers)
     return response
 
 
-def getNewsData(query, start_date, end_date):
+def fetch_news_page(
+    query, start_date, end_date, page, headers, base_url, cancelled=None
+):
+    """
+    Fetch and parse one page of Google News results.
+    Returns the results on the page and whether there is a next page, or None
+    if the request was cancelled, see make_request.
+    """
+    offset = page * RESULTS_PER_PAGE
+    url = (
+        f"{base_url}?q={query}"
+        f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+        f"&tbm=nws&start={offset}"
+    )
+
+    response = make_request(url, headers, cancelled)
+    if response is None:
+        return None
+    soup = BeautifulSoup(response.content, "html.parser")
+
+    news_results = []
+    for el in soup.select("div.SoaBEf"):
+        try:
+            link = el.find("a")["href"]
+            title = el.select_one("div.MBeuO").get_text()
+            snippet = el.select_one(".GI74Re").get_text()
+            date = el.select_one(".LfVVr").get_text()
+            source = el.select_one(".NUnG9d span").get_text()
+            news_results.append(
+                {
+                    "link": link,
+                    "title": title,
+                    "snippet": snippet,
+                    "date": date,
+                    "source": source,
+                }
+            )
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+
+    # Check for the "Next" link (pagination)
+    has_next = soup.find("a", id="pnnext") is not None
+
+    return news_results, has_next
+
+
+def getNewsData(query, start_date, end_date, base_url=GOOGLE_SEARCH_URL):
     """
     Scrape Google News search results for a given query and date range.
     query: str - search query
     start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
     end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+    base_url: str - search endpoint, can point at a local stub server
+
+    The first page is fetched on its own; while there are more, up to
+    `google_news_max_workers` following pages are kept in flight, all paced by
+    the shared Google News rate limiter. Once a page fails, comes back empty or
+    has no next link, no page after it is requested.
     """
     if "-" in start_date:
         start_date = datetime.strptime(start_date, "%Y-%m-%d")
@@ -53,56 +147,57 @@ def getNewsData(query, start_date, end_date):
         )
     }
 
-    news_results = []
-    page = 0
-    while True:
-        offset = page * 10
-        url = (
-            f"https://www.google.com/search?q={query}"
-            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
-        )
+    # the first page known to end the results; later pages are not requested
+    last_page = [None]
+    last_page_lock = threading.Lock()
 
-        try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
-
-            if not results_on_page:
-                break  # No more results found
-
-            for el in results_on_page:
-                try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
-
-            # Update the progress bar with the current count of results scraped
-
-            # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
-                break
+    def ends_results(result):
+        if result is None:
+            return True
+        results_on_page, has_next = result
+        return not results_on_page or not has_next
 
-            page += 1
+    def fetch(page):
+        def cancelled():
+            with last_page_lock:
+                return last_page[0] is not None and page > last_page[0]
 
+        try:
+            result = fetch_news_page(
+                query, start_date, end_date, page, headers, base_url, cancelled
+            )
         except Exception as e:
             print(f"Failed after multiple retries: {e}")
-            break
+            result = None
+        if ends_results(result) and not cancelled():
+            with last_page_lock:
+                if last_page[0] is None or page < last_page[0]:
+                    last_page[0] = page
+        return result
+
+    max_workers = get_config()["google_news_max_workers"]
+
+    news_results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {0: executor.submit(fetch, 0)}
+        next_page = 1
+        page = 0
+        # keep page order, stop at the first page that ends the results
+        while page in futures:
+            result = futures.pop(page).result()
+            if result is not None:
+                news_results.extend(result[0])
+            if ends_results(result):
+                for future in futures.values():
+                    future.cancel()
+                break
+
+            page += 1
+            while next_page < page + max_workers:
+                with last_page_lock:
+                    if last_page[0] is not None and next_page > last_page[0]:
+                        break
+                futures[next_page] = executor.submit(fetch, next_page)
+                next_page += 1
 
     return news_results
@@ -0,0 +1,103 @@
+"""
+Pooled HTTP sessions for the scrapers and REST data providers.
+
+Every named session is a process-wide requests.Session with keep-alive connection
+pools, so repeated requests to the same host reuse an open TCP/TLS connection
+instead of opening a new one each time. Pool size and the default timeout come
+from the config.
+"""
+
+import threading
+from typing import Annotated, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import get_config
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with a default timeout that counts requests and connections."""
+
+    def __init__(self, timeout=None, **kwargs):
+        self.timeout = timeout
+        self._requests = 0
+        self._retired_connections = 0
+        self._metrics_lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        pools = self.poolmanager.pools
+        dispose = pools.dispose_func
+
+        # keep the counts of host pools the manager evicts
+        def retire(pool):
+            with self._metrics_lock:
+                self._retired_connections += pool.num_connections
+            dispose(pool)
+
+        pools.dispose_func = retire
+
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.timeout
+        with self._metrics_lock:
+            self._requests += 1
+        return super().send(request, timeout=timeout, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        pools = self.poolmanager.pools
+        with self._metrics_lock:
+            connections = self._retired_connections + sum(
+                pools[key].num_connections for key in pools.keys()
+            )
+            requests_sent = self._requests
+        return {
+            "requests": requests_sent,
+            "connections_opened": connections,
+            "connections_reused": max(requests_sent - connections, 0),
+        }
+
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_http_session(
+    name: Annotated[str, "name of the provider, e.g. google_news"] = "default",
+) -> requests.Session:
+    """Get the process-wide pooled session for `name`, creating it on first use."""
+    with _sessions_lock:
+        session = _sessions.get(name)
+        if session is None:
+            config = get_config()
+            adapter = PooledHTTPAdapter(
+                timeout=config["http_timeout"],
+                pool_connections=config["http_pool_connections"],
+                pool_maxsize=config["http_pool_maxsize"],
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[name] = session
+        return session
+
+
+def get_http_session_stats() -> Dict[str, Dict[str, int]]:
+    """Requests sent and connections opened/reused by each session so far."""
+    with _sessions_lock:
+        sessions = dict(_sessions)
+    return {
+        name: session.get_adapter("https://").stats()
+        for name, session in sessions.items()
+    }
+
+
+def close_http_sessions():
+    """Close every pooled session and its open connections."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
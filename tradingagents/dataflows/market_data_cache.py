@@ -0,0 +1,191 @@
+"""
+Incremental on-disk cache of daily yfinance bars.
+
+Each symbol has a single cache file, {symbol}-YFin-data in the columnar store,
+plus a small JSON file recording how far it has been
+fetched. The first request downloads the full history; later ones only download
+the bars since the last stored date and merge them in. The date-range named files
+the online tools used to write once per day are deleted when a symbol's cache is
+written.
+"""
+
+import glob
+import json
+import os
+import tempfile
+import threading
+from typing import Annotated, Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from .columnar_store import load_price_frame, normalize_price_frame, save_price_frame
+from .price_cache import get_price_cache
+
+# downloader(symbol, start, end) -> frame with a "Date" column, `end` exclusive
+Downloader = Callable[[str, str, str], pd.DataFrame]
+
+HISTORY_YEARS = 15
+
+
+def yfinance_downloader(symbol: str, start: str, end: str) -> pd.DataFrame:
+    """Download daily bars in [start, end) from Yahoo Finance."""
+    data = yf.download(
+        symbol,
+        start=start,
+        end=end,
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+    )
+    return data.reset_index()
+
+
+class IncrementalPriceCache:
+    """Per-symbol price cache that only downloads bars it does not have yet."""
+
+    _symbol_locks: Dict[str, threading.Lock] = {}
+    _symbol_locks_lock = threading.Lock()
+
+    def __init__(
+        self,
+        cache_dir: Annotated[str, "directory holding the cache files"],
+        downloader: Annotated[
+            Optional[Downloader], "fetches bars, defaults to yfinance"
+        ] = None,
+        history_years: Annotated[int, "years of history to serve"] = HISTORY_YEARS,
+    ):
+        self.cache_dir = cache_dir
+        self.downloader = downloader or yfinance_downloader
+        self.history_years = history_years
+
+    def cache_path(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, f"{symbol}-YFin-data.csv")
+
+    def meta_path(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, f"{symbol}-YFin-data.json")
+
+    def get(
+        self,
+        symbol: Annotated[str, "ticker symbol"],
+        end_date: Annotated[
+            Optional[str], "exclusive end date, YYYY-mm-dd, defaults to today"
+        ] = None,
+    ) -> pd.DataFrame:
+        """
+        Return the last `history_years` of daily bars for `symbol` before `end_date`,
+        bringing the cache up to date first.
+        """
+        end = pd.Timestamp(end_date or pd.Timestamp.today()).normalize()
+        start = end - pd.DateOffset(years=self.history_years)
+
+        with self._lock_for(symbol):
+            data = self._update(symbol, start, end)
+
+        return data[(data["Date"] >= start) & (data["Date"] < end)].reset_index(
+            drop=True
+        )
+
+    def _update(self, symbol, start, end):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.cache_path(symbol)
+
+        try:
+            stored = load_price_frame(path)
+        except FileNotFoundError:
+            stored = None
+
+        if stored is not None and not stored.empty:
+            last_date = stored["Date"].max()
+            fetched_until = self._fetched_until(symbol)
+            if last_date >= end - pd.Timedelta(days=1) or (
+                fetched_until is not None and fetched_until >= end
+            ):
+                return stored
+
+            # re-fetch the last stored bar too: it tells us whether yfinance has
+            # re-adjusted the history (splits, dividends) since we stored it
+            new_bars = self._download(symbol, last_date, end)
+            if self._history_adjusted(stored, new_bars, last_date):
+                data = self._download(symbol, start, end)
+            else:
+                data = (
+                    pd.concat([stored, new_bars], ignore_index=True)
+                    .drop_duplicates("Date", keep="last")
+                    .sort_values("Date", ignore_index=True)
+                )
+        else:
+            data = self._download(symbol, start, end)
+
+        save_price_frame(data, path)
+        with open(self.meta_path(symbol), "w") as f:
+            json.dump({"fetched_until": end.strftime("%Y-%m-%d")}, f)
+        self._remove_superseded(symbol)
+        get_price_cache().invalidate(symbol=symbol, source="yfinance")
+        return data
+
+    def _download(self, symbol, start, end):
+        data = self.downloader(
+            symbol, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+        )
+        return normalize_price_frame(data.reset_index(drop=True))
+
+    def _fetched_until(self, symbol):
+        """Exclusive end date of the last download, so days without new bars
+        (weekends, holidays) are not fetched over and over."""
+        try:
+            with open(self.meta_path(symbol)) as f:
+                return pd.Timestamp(json.load(f)["fetched_until"])
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def _history_adjusted(stored, new_bars, last_date):
+        old = stored.loc[stored["Date"] == last_date, "Close"]
+        new = new_bars.loc[new_bars["Date"] == last_date, "Close"]
+        if old.empty or new.empty:
+            return False
+        return not np.isclose(old.iloc[-1], new.iloc[-1], rtol=1e-4)
+
+    def _remove_superseded(self, symbol):
+        for pattern in (f"{symbol}-YFin-data-*.csv", f"{symbol}-YFin-data-*.feather"):
+            for path in glob.glob(os.path.join(self.cache_dir, pattern)):
+                os.remove(path)
+
+    @classmethod
+    def _lock_for(cls, symbol):
+        with cls._symbol_locks_lock:
+            return cls._symbol_locks.setdefault(symbol, threading.Lock())
+
+
+if __name__ == "__main__":
+    # Offline check with a fake downloader serving synthetic business-day bars
+    calls = []
+
+    def fake_downloader(symbol, start, end):
+        calls.append((start, end))
+        dates = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1))
+        return pd.DataFrame({"Date": dates, "Close": dates.dayofyear.astype(float)})
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # a file left behind by the old date-named cache
+        legacy_file = os.path.join(cache_dir, "FAKE-YFin-data-2010-01-01-2025-01-01.csv")
+        open(legacy_file, "w").close()
+
+        cache = IncrementalPriceCache(cache_dir, downloader=fake_downloader)
+        cache.get("FAKE", "2025-01-06")
+        cache.get("FAKE", "2025-01-06")
+        data = cache.get("FAKE", "2025-01-10")
+
+        assert calls == [
+            ("2010-01-06", "2025-01-06"),
+            ("2025-01-03", "2025-01-10"),
+        ], calls
+        assert data["Date"].max() == pd.Timestamp("2025-01-09")
+        assert data["Date"].is_unique
+        assert sorted(os.listdir(cache_dir)) == [
+            "FAKE-YFin-data.feather",
+            "FAKE-YFin-data.json",
+        ], os.listdir(cache_dir)
+        print(f"Downloads: {calls}")
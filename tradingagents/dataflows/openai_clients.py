@@ -0,0 +1,156 @@
+"""
+Process-wide OpenAI clients.
+
+Clients are created lazily, one per (base_url, api_key), and all of them send
+their requests through one pooled httpx client. The tools, memory embeddings
+and the graph's chat models therefore reuse open connections instead of each
+opening their own. The graph's async chat calls share a pooled
+httpx.AsyncClient that keeps a separate connection pool per event loop, so a
+later asyncio.run never picks up connections of a loop that has ended.
+
+close_openai_clients() closes the pooled connections and is also run when the
+interpreter exits. Clients fetched afterwards are new; chat models and memories
+that still hold the old ones open new connections on their next request.
+"""
+
+import asyncio
+import atexit
+import threading
+import weakref
+from typing import Annotated, Dict, Optional, Tuple
+
+import httpx
+from openai import OpenAI
+
+from .config import get_config
+
+_clients: Dict[Tuple[Optional[str], Optional[str]], OpenAI] = {}
+_http_client: Optional[httpx.Client] = None
+_async_http_client: Optional[httpx.AsyncClient] = None
+_transport: Optional["ReopeningTransport"] = None
+_async_transport: Optional["PerLoopAsyncTransport"] = None
+_lock = threading.Lock()
+
+
+class ReopeningTransport(httpx.BaseTransport):
+    """A connection pool that can be closed and opens a new pool on next use."""
+
+    def __init__(self, limits: httpx.Limits):
+        self._limits = limits
+        self._pool: Optional[httpx.HTTPTransport] = None
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            if self._pool is None:
+                self._pool = httpx.HTTPTransport(limits=self._limits)
+            pool = self._pool
+        return pool.handle_request(request)
+
+    def close(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+
+
+class PerLoopAsyncTransport(httpx.AsyncBaseTransport):
+    """A connection pool per running event loop, dropped with its loop."""
+
+    def __init__(self, limits: httpx.Limits):
+        self._limits = limits
+        self._pools = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pool = self._pools.get(loop)
+            if pool is None:
+                pool = self._pools[loop] = httpx.AsyncHTTPTransport(limits=self._limits)
+        return await pool.handle_async_request(request)
+
+    async def aclose(self):
+        """Close the running loop's pool."""
+        with self._lock:
+            pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.aclose()
+
+    def reset(self):
+        """
+        Forget every loop's pool. Their connections can only be closed from
+        their own loops, so they are left to be collected with them.
+        """
+        with self._lock:
+            self._pools.clear()
+
+
+def _pool_settings():
+    config = get_config()
+    limits = httpx.Limits(
+        max_connections=config["openai_max_connections"],
+        max_keepalive_connections=config["openai_max_connections"],
+    )
+    return limits, httpx.Timeout(config["openai_timeout"], connect=10.0)
+
+
+def get_http_client() -> httpx.Client:
+    """The pooled httpx client shared by every OpenAI client and chat model."""
+    global _http_client, _transport
+    with _lock:
+        if _http_client is None:
+            limits, timeout = _pool_settings()
+            _transport = ReopeningTransport(limits)
+            _http_client = httpx.Client(transport=_transport, timeout=timeout)
+        return _http_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """The pooled httpx client shared by the chat models' async calls."""
+    global _async_http_client, _async_transport
+    with _lock:
+        if _async_http_client is None:
+            limits, timeout = _pool_settings()
+            _async_transport = PerLoopAsyncTransport(limits)
+            _async_http_client = httpx.AsyncClient(
+                transport=_async_transport, timeout=timeout
+            )
+        return _async_http_client
+
+
+def get_openai_client(
+    base_url: Annotated[Optional[str], "API base URL, None for OpenAI's"] = None,
+    api_key: Annotated[
+        Optional[str], "API key, None to read OPENAI_API_KEY"
+    ] = None,
+) -> OpenAI:
+    """Get the shared OpenAI client for `base_url` and `api_key`."""
+    http_client = get_http_client()
+    with _lock:
+        client = _clients.get((base_url, api_key))
+        if client is None:
+            client = _clients[(base_url, api_key)] = OpenAI(
+                base_url=base_url, api_key=api_key, http_client=http_client
+            )
+        return client
+
+
+def close_openai_clients():
+    """
+    Close the shared clients' connections. The next get_* call builds new
+    clients from the current config.
+    """
+    global _http_client, _async_http_client, _transport, _async_transport
+    with _lock:
+        _clients.clear()
+        transport, async_transport = _transport, _async_transport
+        _http_client = _async_http_client = None
+        _transport = _async_transport = None
+    if transport is not None:
+        transport.close()
+    if async_transport is not None:
+        async_transport.reset()
+
+
+atexit.register(close_openai_clients)
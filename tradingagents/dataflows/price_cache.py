@@ -0,0 +1,150 @@
+import threading
+from collections import OrderedDict
+from typing import Annotated, Callable, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+from .columnar_store import load_price_frame
+from .config import get_config
+
+# (symbol, source, (start_date, end_date))
+PriceCacheKey = Tuple[str, str, Hashable]
+
+
+class PriceFrameCache:
+    """
+    Process-wide in-memory cache of parsed price frames.
+
+    Frames are keyed by (symbol, source, range), evicted least-recently-used first
+    once the total in-memory size exceeds `max_bytes`, and handed out as copies so
+    callers are free to add or modify columns.
+    """
+
+    def __init__(self, max_bytes: Annotated[int, "memory budget in bytes"]):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._frames: "OrderedDict[PriceCacheKey, Tuple[pd.DataFrame, int]]" = (
+            OrderedDict()
+        )
+        self._size = 0
+        self._lock = threading.Lock()
+        self._key_locks: Dict[PriceCacheKey, threading.Lock] = {}
+
+    def get(
+        self,
+        key: PriceCacheKey,
+        loader: Annotated[
+            Callable[[], pd.DataFrame], "loads the frame when it is not cached"
+        ],
+    ) -> pd.DataFrame:
+        """Return a copy of the frame cached under `key`, loading it on a miss."""
+        frame = self._lookup(key)
+        if frame is not None:
+            return frame.copy()
+
+        # only one thread loads a given key, the others wait and then hit
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                frame = self._lookup(key, count_miss=True)
+                if frame is None:
+                    frame = loader()
+                    self._store(key, frame)
+        finally:
+            with self._lock:
+                self._key_locks.pop(key, None)
+
+        return frame.copy()
+
+    def invalidate(
+        self,
+        symbol: Optional[str] = None,
+        source: Optional[str] = None,
+    ) -> int:
+        """
+        Drop cached frames. With no arguments the whole cache is cleared, otherwise
+        only frames matching the given symbol and/or source. Returns the number of
+        frames dropped.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._frames
+                if (symbol is None or key[0] == symbol)
+                and (source is None or key[1] == source)
+            ]
+            for key in keys:
+                _, size = self._frames.pop(key)
+                self._size -= size
+        return len(keys)
+
+    def set_max_bytes(self, max_bytes: int):
+        """Change the memory budget, evicting frames if the cache is now over it."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._frames),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _lookup(self, key, count_miss=False):
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is not None:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if count_miss:
+                self.misses += 1
+            return None
+
+    def _store(self, key, frame):
+        size = int(frame.memory_usage(index=True, deep=True).sum())
+        with self._lock:
+            if size > self.max_bytes:
+                # would evict everything else and still not fit, don't cache it
+                return
+            self._frames[key] = (frame, size)
+            self._size += size
+            self._evict()
+
+    def _evict(self):
+        while self._size > self.max_bytes and self._frames:
+            _, (_, size) = self._frames.popitem(last=False)
+            self._size -= size
+            self.evictions += 1
+
+
+_price_cache: Optional[PriceFrameCache] = None
+_price_cache_lock = threading.Lock()
+
+
+def get_price_cache() -> PriceFrameCache:
+    """Get the shared price frame cache, sized by the `price_cache_max_bytes` config."""
+    global _price_cache
+    max_bytes = get_config()["price_cache_max_bytes"]
+    with _price_cache_lock:
+        if _price_cache is None:
+            _price_cache = PriceFrameCache(max_bytes)
+    if _price_cache.max_bytes != max_bytes:
+        _price_cache.set_max_bytes(max_bytes)
+    return _price_cache
+
+
+def load_cached_price_frame(
+    path: Annotated[str, "path of the price CSV"],
+    key: Annotated[PriceCacheKey, "(symbol, source, range) the file holds"],
+) -> pd.DataFrame:
+    """Load a price file from the columnar store through the shared price frame cache."""
+    return get_price_cache().get(key, lambda: load_price_frame(path))
@@ -0,0 +1,76 @@
+import threading
+import time
+from typing import Annotated, Dict
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill at `rate` per second up to `capacity`; acquire() blocks until
+    a token is available. pause() stops handing out tokens for a while, e.g. when
+    a server answers with Retry-After, so every thread sharing the bucket backs off.
+    """
+
+    def __init__(
+        self,
+        rate: Annotated[float, "tokens added per second"],
+        capacity: Annotated[float, "maximum burst size"],
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = max(
+                    self._paused_until - now,
+                    (tokens - self._tokens) / self.rate,
+                )
+            time.sleep(wait)
+
+    def pause(self, seconds: Annotated[float, "how long to hand out no tokens"]):
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    def configure(self, rate: float, capacity: float):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+            self.capacity = capacity
+            self._tokens = min(self._tokens, capacity)
+
+    def _refill(self, now):
+        if now > self._paused_until:
+            start = max(self._updated, self._paused_until)
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated = now
+
+
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    name: Annotated[str, "name of the limited resource, e.g. google_news"],
+    rate: Annotated[float, "tokens added per second"],
+    capacity: Annotated[float, "maximum burst size"],
+) -> TokenBucket:
+    """Get the process-wide limiter for `name`, shared across tickers and threads."""
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = _limiters[name] = TokenBucket(rate, capacity)
+    if (limiter.rate, limiter.capacity) != (rate, capacity):
+        limiter.configure(rate, capacity)
+    return limiter
@@ -1,9 +1,12 @@
 import requests
 import time
 import json
+import heapq
+import threading
 from datetime import datetime, timedelta
 from contextlib import contextmanager
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Dict, List
 import os
 import re
 
@@ -49,6 +52,118 @@ ticker_to_company = {
 }
 
 
+@lru_cache(maxsize=None)
+def company_matcher(
+    query: Annotated[str, "Ticker symbol, a key of ticker_to_company."],
+) -> "re.Pattern":
+    """
+    Case-insensitive pattern matching any of the company's names or its ticker.
+
+    The names in ticker_to_company ("Meta OR Facebook") and the ticker are joined
+    into one alternation, compiled once per ticker and cached.
+    """
+    if "OR" in ticker_to_company[query]:
+        search_terms = ticker_to_company[query].split(" OR ")
+    else:
+        search_terms = [ticker_to_company[query]]
+
+    search_terms.append(query)
+
+    return re.compile(
+        "|".join(f"(?:{term})" for term in search_terms), re.IGNORECASE
+    )
+
+
+# (category, file) -> {"size", "mtime", "days": {yyyy-mm-dd: [byte offsets]}}
+_day_indexes: Dict[tuple, Dict] = {}
+_day_indexes_lock = threading.Lock()
+
+
+def _day_index_path(base_path, category, data_file):
+    # kept outside the category folder, whose file count sets the per-subreddit limit
+    return os.path.join(base_path, ".index", category, data_file + ".json")
+
+
+def _build_day_index(file_path):
+    """Scan a subreddit .jsonl once, recording the byte offset of every post by UTC day."""
+    days = {}
+    offset = 0
+    with open(file_path, "rb") as f:
+        for line in f:
+            # skip empty lines
+            if line.strip():
+                parsed_line = json.loads(line)
+                post_date = datetime.utcfromtimestamp(
+                    parsed_line["created_utc"]
+                ).strftime("%Y-%m-%d")
+                days.setdefault(post_date, []).append(offset)
+            offset += len(line)
+    return days
+
+
+def get_day_offsets(
+    base_path: Annotated[str, "Path to the reddit data folder."],
+    category: Annotated[str, "Category (folder) of the subreddit file."],
+    data_file: Annotated[str, "Subreddit .jsonl file name."],
+) -> Dict[str, List[int]]:
+    """
+    Per-day byte offsets of the posts in a subreddit file, in file order.
+
+    The index is built on first use, saved under {base_path}/.index and kept in
+    memory; it is rebuilt whenever the subreddit file's size or mtime changes.
+    """
+    file_path = os.path.join(base_path, category, data_file)
+    stat = os.stat(file_path)
+    key = (os.path.abspath(base_path), category, data_file)
+
+    with _day_indexes_lock:
+        index = _day_indexes.get(key)
+    if index is None:
+        try:
+            with open(_day_index_path(base_path, category, data_file)) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = None
+
+    if index is None or (index["size"], index["mtime"]) != (
+        stat.st_size,
+        stat.st_mtime,
+    ):
+        index = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "days": _build_day_index(file_path),
+        }
+        index_path = _day_index_path(base_path, category, data_file)
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            with open(index_path, "w") as f:
+                json.dump(index, f)
+        except OSError:
+            # read-only data folder, keep the index in memory only
+            pass
+
+    with _day_indexes_lock:
+        _day_indexes[key] = index
+    return index["days"]
+
+
+def build_reddit_index(
+    data_path: Annotated[str, "Path to the reddit data folder."],
+) -> int:
+    """Build (or refresh) the day index of every subreddit file. Returns the number of files indexed."""
+    indexed = 0
+    for category in os.listdir(data_path):
+        category_path = os.path.join(data_path, category)
+        if category.startswith(".") or not os.path.isdir(category_path):
+            continue
+        for data_file in os.listdir(category_path):
+            if data_file.endswith(".jsonl"):
+                get_day_offsets(data_path, category, data_file)
+                indexed += 1
+    return indexed
+
+
 def fetch_top_from_category(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
@@ -61,9 +176,41 @@ def fetch_top_from_category(
         "Path to the data folder. Default is 'reddit_data'.",
     ] = "reddit_data",
 ):
+    return fetch_top_from_category_range(
+        category, date, date, max_limit, query, data_path=data_path
+    )
+
+
+def fetch_top_from_category_range(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd."],
+    end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    """
+    Top posts of every day in [start_date, end_date], each subreddit file read once.
+
+    Same result as calling fetch_top_from_category for each day in turn: posts are
+    ordered by day, then subreddit, then upvotes, and every subreddit contributes
+    at most max_limit // (number of files in the category) posts per day.
+    """
     base_path = data_path
 
-    all_content = []
+    days = []
+    curr_date = datetime.strptime(start_date, "%Y-%m-%d")
+    while curr_date <= datetime.strptime(end_date, "%Y-%m-%d"):
+        days.append(curr_date.strftime("%Y-%m-%d"))
+        curr_date += timedelta(days=1)
+
+    if not days:
+        return []
 
     if max_limit < len(os.listdir(os.path.join(base_path, category))):
         raise ValueError(
@@ -74,49 +221,42 @@ def fetch_top_from_category(
         os.listdir(os.path.join(base_path, category))
     )
 
+    # day -> top posts of each subreddit, in subreddit file order
+    content_by_day = {day: [] for day in days}
+
     for data_file in os.listdir(os.path.join(base_path, category)):
         # check if data_file is a .jsonl file
         if not data_file.endswith(".jsonl"):
             continue
 
-        all_content_curr_subreddit = []
+        # per-day min-heaps of (upvotes, -line number, post) holding the current
+        # top posts; earlier lines win ties, as with a stable sort
+        top_posts = {day: [] for day in days}
 
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
-
-                parsed_line = json.loads(line)
+        # only read the lines the day index points at for these dates, in one
+        # forward pass over the file
+        day_offsets = get_day_offsets(base_path, category, data_file)
+        offsets = sorted(
+            (offset, day) for day in days for offset in day_offsets.get(day, [])
+        )
 
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
+        with open(os.path.join(base_path, category, data_file), "rb") as f:
+            for line_number, (offset, post_date) in enumerate(offsets):
+                f.seek(offset)
+                parsed_line = json.loads(f.readline())
 
                 # if is company_news, check that the title or the content has the company's name (query) mentioned
                 if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
+                    matcher = company_matcher(query)
+                    if not (
+                        matcher.search(parsed_line["title"])
+                        or matcher.search(parsed_line["selftext"])
+                    ):
                         continue
 
+                if limit_per_subreddit <= 0:
+                    continue
+
                 post = {
                     "title": parsed_line["title"],
                     "content": parsed_line["selftext"],
@@ -125,11 +265,15 @@ def fetch_top_from_category(
                     "posted_date": post_date,
                 }
 
-                all_content_curr_subreddit.append(post)
-
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+                heap = top_posts[post_date]
+                entry = (post["upvotes"], -line_number, post)
+                if len(heap) < limit_per_subreddit:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
+        for day, heap in top_posts.items():
+            heap.sort(key=lambda entry: entry[:2], reverse=True)
+            content_by_day[day].extend(post for _, _, post in heap)
 
-    return all_content
+    return [post for day in days for post in content_by_day[day]]
@@ -0,0 +1,195 @@
+"""
+Persistent cache of tool results, stored in a single SQLite file.
+
+Results are JSON values stored under a namespace (one per tool, e.g. google_news)
+and a content-addressed key, the sha256 of the normalized inputs. Entries expire
+after the namespace's TTL. Concurrent requests for the same key are
+single-flighted, so only one thread computes a missing result and the others
+read it from the cache.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Annotated, Any, Callable, Dict, Optional
+
+from .config import get_config
+
+
+def make_cache_key(*parts) -> str:
+    """sha256 of the JSON encoding of `parts`."""
+    encoded = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """A namespace of JSON results in a SQLite cache file, with a TTL."""
+
+    _connections: Dict[str, tuple] = {}  # path -> (connection, lock)
+    _connections_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: Annotated[str, "SQLite file holding the cache"],
+        namespace: Annotated[str, "name of the tool whose results are cached"],
+        ttl_seconds: Annotated[Optional[float], "how long entries stay fresh"] = None,
+    ):
+        self.path = path
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """The fresh value stored under `key`, or None."""
+        conn, lock = self._connect()
+        with lock:
+            row = conn.execute(
+                "SELECT value, created FROM results WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+        if row is None:
+            return None
+        value, created = row
+        if self.ttl_seconds is not None and time.time() - created > self.ttl_seconds:
+            return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Any):
+        conn, lock = self._connect()
+        with lock, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (namespace, key, value, created) "
+                "VALUES (?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value), time.time()),
+            )
+
+    def get_or_compute(
+        self,
+        key: Annotated[str, "cache key, see make_cache_key"],
+        compute: Annotated[Callable[[], Any], "computes the result on a miss"],
+        store_if: Annotated[
+            Optional[Callable[[Any], bool]], "whether a computed result is cached"
+        ] = None,
+    ) -> Any:
+        """Return the cached result for `key`, computing and storing it on a miss."""
+        value = self.get(key)
+        if value is not None:
+            self._count(hit=True)
+            return value
+
+        with self._stats_lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                # another thread may have stored it while we waited
+                value = self.get(key)
+                if value is not None:
+                    self._count(hit=True)
+                    return value
+                self._count(hit=False)
+                value = compute()
+                if store_if is None or store_if(value):
+                    self.set(key, value)
+                return value
+        finally:
+            with self._stats_lock:
+                self._key_locks.pop(key, None)
+
+    def purge_expired(self):
+        """Delete this namespace's expired entries."""
+        if self.ttl_seconds is None:
+            return
+        conn, lock = self._connect()
+        with lock, conn:
+            conn.execute(
+                "DELETE FROM results WHERE namespace = ? AND created < ?",
+                (self.namespace, time.time() - self.ttl_seconds),
+            )
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def _count(self, hit):
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _connect(self):
+        with self._connections_lock:
+            if self.path not in self._connections:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                    "created REAL NOT NULL, PRIMARY KEY (namespace, key))"
+                )
+                conn.commit()
+                self._connections[self.path] = (conn, threading.Lock())
+            return self._connections[self.path]
+
+
+_caches: Dict[tuple, ResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_result_cache(
+    namespace: Annotated[str, "name of the tool whose results are cached"],
+    ttl_seconds: Annotated[Optional[float], "how long entries stay fresh"] = None,
+) -> ResultCache:
+    """
+    Get the process-wide cache for `namespace` and `ttl_seconds` in the
+    configured cache file, data_cache_dir/result_cache.sqlite3 unless
+    result_cache_path is set. Callers asking for different TTLs get separate
+    caches over the same entries, so one caller's TTL never applies to another.
+    Entries that have expired are purged when a cache is first opened.
+    """
+    config = get_config()
+    path = config["result_cache_path"] or os.path.join(
+        config["data_cache_dir"], "result_cache.sqlite3"
+    )
+    with _caches_lock:
+        cache = _caches.get((path, namespace, ttl_seconds))
+        if cache is None:
+            cache = _caches[(path, namespace, ttl_seconds)] = ResultCache(
+                path, namespace, ttl_seconds
+            )
+            # drop what expired since the cache file was last used
+            cache.purge_expired()
+    return cache
+
+
+def get_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Hits and misses of every result cache used in this process, by namespace."""
+    with _caches_lock:
+        caches = list(_caches.values())
+    stats: Dict[str, Dict[str, int]] = {}
+    for cache in caches:
+        namespace_stats = stats.setdefault(cache.namespace, {"hits": 0, "misses": 0})
+        for name, count in cache.stats().items():
+            namespace_stats[name] += count
+    return stats
+
+
+def cache_stats_delta(
+    before: Annotated[Dict[str, Dict[str, int]], "get_cache_stats() at the start"],
+    after: Annotated[Dict[str, Dict[str, int]], "get_cache_stats() at the end"],
+) -> Dict[str, Dict[str, int]]:
+    """Hits and misses by namespace between two get_cache_stats() snapshots."""
+    return {
+        namespace: {
+            name: count - before.get(namespace, {}).get(name, 0)
+            for name, count in stats.items()
+        }
+        for namespace, stats in after.items()
+    }
@@ -0,0 +1,70 @@
+import threading
+from typing import Annotated, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class SimFinStatementIndex:
+    """
+    A SimFin bulk statement CSV (e.g. us-balance-annual.csv) loaded once and
+    indexed by ticker, for point-in-time lookups of the latest published report.
+
+    Each ticker maps to its rows' Publish Dates sorted ascending, so the latest
+    report published on or before a date is found by binary search.
+    """
+
+    def __init__(self, data_path: Annotated[str, "path of the SimFin CSV"]):
+        df = pd.read_csv(data_path, sep=";")
+
+        # Convert date strings to datetime objects and remove any time components
+        df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+        df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+
+        self.data = df
+        self._tickers: Dict[str, tuple] = {}
+
+        published = df["Publish Date"].notna().values
+        publish_ns = df["Publish Date"].values.view("i8")
+        for ticker, positions in df.groupby("Ticker").indices.items():
+            positions = positions[published[positions]]
+            # stable, so rows published on the same day keep their file order
+            order = np.argsort(publish_ns[positions], kind="stable")
+            positions = positions[order]
+            self._tickers[ticker] = (publish_ns[positions], df.index.values[positions])
+
+    def latest_as_of(
+        self,
+        ticker: Annotated[str, "ticker symbol"],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ) -> Optional[pd.Series]:
+        """
+        The row with the latest Publish Date on or before `curr_date`, or None if
+        the ticker has no report published by then. Among reports published on
+        the same day the first one in the file wins.
+        """
+        if ticker not in self._tickers:
+            return None
+        publish_ns, labels = self._tickers[ticker]
+
+        curr_date_ns = pd.to_datetime(curr_date, utc=True).normalize().value
+        latest = np.searchsorted(publish_ns, curr_date_ns, side="right") - 1
+        if latest < 0:
+            return None
+        first = np.searchsorted(publish_ns, publish_ns[latest], side="left")
+
+        return self.data.loc[labels[first]]
+
+
+_indexes: Dict[str, SimFinStatementIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_simfin_statement_index(
+    data_path: Annotated[str, "path of the SimFin CSV"],
+) -> SimFinStatementIndex:
+    """Get the index of a SimFin statement CSV, building it on first use in the process."""
+    with _indexes_lock:
+        if data_path not in _indexes:
+            _indexes[data_path] = SimFinStatementIndex(data_path)
+        return _indexes[data_path]
@@ -1,9 +1,13 @@
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
-from typing import Annotated
+from typing import Annotated, Dict, List
 import os
 from .config import get_config
+from .market_data_cache import IncrementalPriceCache
+from .price_cache import get_price_cache, load_cached_price_frame
+
+
+NOT_TRADING_DAY = "N/A: Not a trading day (weekend or holiday)"
 
 
 class StockstatsUtils:
@@ -25,63 +29,99 @@ class StockstatsUtils:
             "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
         ] = False,
     ):
-        df = None
-        data = None
+        df = StockstatsUtils._load_stock_stats_frame(symbol, data_dir, online)
+        if online:
+            curr_date = pd.to_datetime(curr_date).strftime("%Y-%m-%d")
+
+        df[indicator]  # trigger stockstats to calculate the indicator
+        matching_rows = df[df["Date"].str.startswith(curr_date)]
+
+        if not matching_rows.empty:
+            indicator_value = matching_rows[indicator].values[0]
+            return indicator_value
+        else:
+            return NOT_TRADING_DAY
+
+    @staticmethod
+    def get_stock_stats_window(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        dates: Annotated[List[str], "dates to look the indicator up for, YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+        trading_days_only: Annotated[
+            bool,
+            "whether to drop dates that are not in the price data instead of marking them N/A.",
+        ] = False,
+    ) -> Dict[str, object]:
+        """
+        Look up an indicator for many dates at once.
+
+        Equivalent to calling get_stock_stats once per date, but the price data is
+        loaded and the indicator column is computed a single time, and the values
+        for all dates are then picked out of it in one pass.
+
+        Returns:
+            dict: date -> indicator value, in the order of `dates`
+        """
+        df = StockstatsUtils._load_stock_stats_frame(symbol, data_dir, online)
+        df[indicator]  # trigger stockstats to calculate the indicator
+
+        # get_stock_stats takes the first row whose date starts with the requested
+        # day, so keep the first value seen for every day
+        day_keys = df["Date"].str[:10]
+        first_rows = ~day_keys.duplicated()
+        values_by_day = dict(
+            zip(day_keys[first_rows].values, df[indicator].values[first_rows.values])
+        )
+
+        if trading_days_only:
+            trading_days = set(
+                pd.to_datetime(df["Date"], utc=True).astype(str).str[:10].values
+            )
+            dates = [date for date in dates if date in trading_days]
+
+        return {date: values_by_day.get(date, NOT_TRADING_DAY) for date in dates}
 
+    @staticmethod
+    def _load_stock_stats_frame(symbol: str, data_dir: str, online: bool):
+        """Load the price data for `symbol` wrapped for stockstats, with "Date" as strings."""
         if not online:
             try:
-                data = pd.read_csv(
+                data = load_cached_price_frame(
                     os.path.join(
                         data_dir,
                         f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
+                    ),
+                    (symbol, "offline", ("2015-01-01", "2025-03-25")),
                 )
                 df = wrap(data)
             except FileNotFoundError:
                 raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
         else:
-            # Get today's date as YYYY-mm-dd to add to cache
+            # Serve the last 15 years up to today from the incremental cache
             today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
 
             end_date = today_date
             start_date = today_date - pd.DateOffset(years=15)
             start_date = start_date.strftime("%Y-%m-%d")
             end_date = end_date.strftime("%Y-%m-%d")
 
-            # Get config and ensure cache directory exists
-            config = get_config()
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
+            market_data_cache = IncrementalPriceCache(get_config()["data_cache_dir"])
+            data = get_price_cache().get(
+                (symbol, "yfinance", (start_date, end_date)),
+                lambda: market_data_cache.get(symbol, end_date),
             )
-
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
-
             df = wrap(data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
 
-        df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date)]
+        df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
 
-        if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
-            return indicator_value
-        else:
-            return "N/A: Not a trading day (weekend or holiday)"
+        return df
@@ -7,6 +7,14 @@ load_dotenv()
 DEFAULT_CONFIG = {
     "project_dir": os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
     "results_dir": os.getenv("TRADINGAGENTS_RESULTS_DIR", "./results"),
+    "memory_dir": os.getenv("TRADINGAGENTS_MEMORY_DIR", "./memory"),
+    "embedding_backend": os.getenv("TRADINGAGENTS_EMBEDDING_BACKEND", "openai"),
+    "hashing_embedding_dimensions": 1024,
+    "hashing_embedding_ngram_range": (2, 4),
+    "embedding_batch_size": 256,
+    "embedding_batch_max_tokens": 250000,
+    "embedding_cache_size": 1024,
+    "embedding_cache_persist": False,
     "data_dir": "/Users/yluo/Documents/Code/ScAI/FR1-data",
     "data_cache_dir": os.path.join(
         os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
@@ -21,6 +29,30 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Graph settings
+    "parallel_analysts": False,
     # Tool settings
     "online_tools": True,
+    "tool_max_workers": 8,
+    "tool_concurrency_limits": {
+        "get_stock_news_openai": 2,
+        "get_global_news_openai": 2,
+        "get_fundamentals_openai": 2,
+        "get_google_news": 2,
+    },
+    # Data cache settings
+    "price_cache_max_bytes": 256 * 1024 * 1024,
+    "result_cache_path": None,
+    "google_news_cache_ttl": 7 * 24 * 60 * 60,
+    "openai_search_cache_ttl": 24 * 60 * 60,
+    # HTTP settings
+    "http_pool_connections": 10,
+    "http_pool_maxsize": 10,
+    "http_timeout": (10, 30),
+    "openai_max_connections": 20,
+    "openai_timeout": 600.0,
+    # Google News scraping settings
+    "google_news_max_workers": 4,
+    "google_news_requests_per_second": 0.5,
+    "google_news_burst": 2,
 }
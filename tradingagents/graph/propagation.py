@@ -1,7 +1,8 @@
 # TradingAgents/graph/propagation.py
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 from tradingagents.agents.utils.agent_states import (
+    ANALYST_MESSAGE_KEYS,
     AgentState,
     InvestDebateState,
     RiskDebateState,
@@ -19,7 +20,7 @@ class Propagator:
         self, company_name: str, trade_date: str
     ) -> Dict[str, Any]:
         """Create the initial state for the agent graph."""
-        return {
+        state = {
             "messages": [("human", company_name)],
             "company_of_interest": company_name,
             "trade_date": str(trade_date),
@@ -40,6 +41,23 @@ class Propagator:
             "sentiment_report": "",
             "news_report": "",
         }
+        # every analyst starts its own conversation from the company name
+        for messages_key in ANALYST_MESSAGE_KEYS.values():
+            state[messages_key] = [("human", company_name)]
+        return state
+
+    def get_new_messages(self, chunk: Dict[str, Any], seen: Dict[str, int]) -> List:
+        """Messages added to any message channel since the previously streamed chunk.
+
+        `seen` maps each channel to how many of its messages were already
+        returned and is updated in place; start with an empty dict.
+        """
+        new_messages = []
+        for messages_key in ["messages", *ANALYST_MESSAGE_KEYS.values()]:
+            messages = chunk.get(messages_key, [])
+            new_messages.extend(messages[seen.get(messages_key, 0) :])
+            seen[messages_key] = len(messages)
+        return new_messages
 
     def get_graph_args(self) -> Dict[str, Any]:
         """Get arguments for the graph invocation."""
@@ -0,0 +1,61 @@
+# TradingAgents/graph/tool_execution.py
+
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+from langchain_core.tools import BaseTool
+
+
+class ToolExecutor:
+    """Bounded thread pool for tool calls, with per-tool concurrency limits.
+
+    One executor is shared by every tool node of a graph, so the limits hold
+    across analysts running in parallel and across concurrent runs.
+    """
+
+    def __init__(
+        self, max_workers: int, concurrency_limits: Optional[Dict[str, int]] = None
+    ):
+        """Initialize with the pool size and the maximum concurrent calls per tool name."""
+        self.max_workers = max_workers
+        self._pool = ContextThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="tool"
+        )
+        self._limits = {
+            name: threading.BoundedSemaphore(limit)
+            for name, limit in (concurrency_limits or {}).items()
+        }
+
+    def wrap(self, tool: BaseTool) -> BaseTool:
+        """A copy of `tool` whose calls run on the pool, within the tool's limit.
+
+        The copy has a sync and an async implementation, so a stock ToolNode
+        runs it on the pool under both invoke and ainvoke.
+        """
+        func = tool.func
+
+        def run(*args, **kwargs):
+            return self._submit(tool.name, func, *args, **kwargs).result()
+
+        async def arun(*args, **kwargs):
+            # the tools are blocking functions, so they still run on the pool
+            return await asyncio.wrap_future(
+                self._submit(tool.name, func, *args, **kwargs)
+            )
+
+        return tool.model_copy(update={"func": run, "coroutine": arun})
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True)
+
+    def _submit(self, name: str, fn: Callable, *args, **kwargs):
+        return self._pool.submit(self._run_limited, name, fn, *args, **kwargs)
+
+    def _run_limited(self, name: str, fn: Callable, *args, **kwargs) -> Any:
+        limit = self._limits.get(name)
+        if limit is None:
+            return fn(*args, **kwargs)
+        with limit:
+            return fn(*args, **kwargs)
@@ -3,6 +3,8 @@
 import os
 from pathlib import Path
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from typing import Dict, Any, Tuple, List, Optional
 
@@ -14,19 +16,26 @@ from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
 from tradingagents.default_config import DEFAULT_CONFIG
-from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.agents.utils.memory import MemoryService
 from tradingagents.agents.utils.agent_states import (
+    ANALYST_MESSAGE_KEYS,
     AgentState,
     InvestDebateState,
     RiskDebateState,
 )
 from tradingagents.dataflows.interface import set_config
+from tradingagents.dataflows.result_cache import cache_stats_delta, get_cache_stats
+from tradingagents.dataflows.openai_clients import (
+    get_async_http_client,
+    get_http_client,
+)
 
 from .conditional_logic import ConditionalLogic
 from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .tool_execution import ToolExecutor
 
 
 class TradingAgentsGraph:
@@ -58,9 +67,12 @@ class TradingAgentsGraph:
         )
 
         # Initialize LLMs
+        # OpenAI-compatible chat models share the dataflows' pooled HTTP clients
+        http_client = get_http_client()
+        http_async_client = get_async_http_client()
         if self.config["llm_provider"].lower() in ["openai", "ollama", "openrouter"]:
-            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
+            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"], http_client=http_client, http_async_client=http_async_client)
+            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"], http_client=http_client, http_async_client=http_async_client)
         elif self.config["llm_provider"].lower() == "anthropic":
             self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
             self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
@@ -71,23 +83,31 @@ class TradingAgentsGraph:
             self.deep_thinking_llm = ChatOpenAI(
                 model=self.config["deep_think_llm"], 
                 base_url=self.config["backend_url"],
-                api_key=os.getenv("DEEPSEEK_API_KEY")
+                api_key=os.getenv("DEEPSEEK_API_KEY"),
+                http_client=http_client,
+                http_async_client=http_async_client,
             )
             self.quick_thinking_llm = ChatOpenAI(
                 model=self.config["quick_think_llm"], 
                 base_url=self.config["backend_url"],
-                api_key=os.getenv("DEEPSEEK_API_KEY")
+                api_key=os.getenv("DEEPSEEK_API_KEY"),
+                http_client=http_client,
+                http_async_client=http_async_client,
             )
         elif self.config["llm_provider"].lower() == "moonshot（海外版）":
             self.deep_thinking_llm = ChatOpenAI(
                 model=self.config["deep_think_llm"], 
                 base_url=self.config["backend_url"],
-                api_key=os.getenv("MOONSHOT_API_KEY")
+                api_key=os.getenv("MOONSHOT_API_KEY"),
+                http_client=http_client,
+                http_async_client=http_async_client,
             )
             self.quick_thinking_llm = ChatOpenAI(
                 model=self.config["quick_think_llm"], 
                 base_url=self.config["backend_url"],
-                api_key=os.getenv("MOONSHOT_API_KEY")
+                api_key=os.getenv("MOONSHOT_API_KEY"),
+                http_client=http_client,
+                http_async_client=http_async_client,
             )
         else:
             raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
@@ -95,13 +115,18 @@ class TradingAgentsGraph:
         self.toolkit = Toolkit(config=self.config)
 
         # Initialize memories
-        self.bull_memory = FinancialSituationMemory("bull_memory", self.config)
-        self.bear_memory = FinancialSituationMemory("bear_memory", self.config)
-        self.trader_memory = FinancialSituationMemory("trader_memory", self.config)
-        self.invest_judge_memory = FinancialSituationMemory("invest_judge_memory", self.config)
-        self.risk_manager_memory = FinancialSituationMemory("risk_manager_memory", self.config)
-
-        # Create tool nodes
+        # (one vector store and embedding backend, with a collection per role)
+        self.memory_service = MemoryService(self.config)
+        self.bull_memory = self.memory_service.memory("bull_memory")
+        self.bear_memory = self.memory_service.memory("bear_memory")
+        self.trader_memory = self.memory_service.memory("trader_memory")
+        self.invest_judge_memory = self.memory_service.memory("invest_judge_memory")
+        self.risk_manager_memory = self.memory_service.memory("risk_manager_memory")
+
+        # Create tool nodes, sharing one bounded pool for their tool calls
+        self.tool_executor = ToolExecutor(
+            self.config["tool_max_workers"], self.config["tool_concurrency_limits"]
+        )
         self.tool_nodes = self._create_tool_nodes()
 
         # Initialize components
@@ -129,50 +154,60 @@ class TradingAgentsGraph:
         self.log_states_dict = {}  # date to full state dict
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts, parallel_analysts=self.config["parallel_analysts"]
+        )
 
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
-        """Create tool nodes for different data sources."""
+        """Create tool nodes for different data sources.
+
+        Their tool calls run on the shared tool executor.
+        """
+        tool = self.tool_executor.wrap
         return {
             "market": ToolNode(
                 [
                     # online tools
-                    self.toolkit.get_YFin_data_online,
-                    self.toolkit.get_stockstats_indicators_report_online,
+                    tool(self.toolkit.get_YFin_data_online),
+                    tool(self.toolkit.get_stockstats_indicators_report_online),
                     # offline tools
-                    self.toolkit.get_YFin_data,
-                    self.toolkit.get_stockstats_indicators_report,
-                ]
+                    tool(self.toolkit.get_YFin_data),
+                    tool(self.toolkit.get_stockstats_indicators_report),
+                ],
+                messages_key=ANALYST_MESSAGE_KEYS["market"],
             ),
             "social": ToolNode(
                 [
                     # online tools
-                    self.toolkit.get_stock_news_openai,
+                    tool(self.toolkit.get_stock_news_openai),
                     # offline tools
-                    self.toolkit.get_reddit_stock_info,
-                ]
+                    tool(self.toolkit.get_reddit_stock_info),
+                ],
+                messages_key=ANALYST_MESSAGE_KEYS["social"],
             ),
             "news": ToolNode(
                 [
                     # online tools
-                    self.toolkit.get_global_news_openai,
-                    self.toolkit.get_google_news,
+                    tool(self.toolkit.get_global_news_openai),
+                    tool(self.toolkit.get_google_news),
                     # offline tools
-                    self.toolkit.get_finnhub_news,
-                    self.toolkit.get_reddit_news,
-                ]
+                    tool(self.toolkit.get_finnhub_news),
+                    tool(self.toolkit.get_reddit_news),
+                ],
+                messages_key=ANALYST_MESSAGE_KEYS["news"],
             ),
             "fundamentals": ToolNode(
                 [
                     # online tools
-                    self.toolkit.get_fundamentals_openai,
+                    tool(self.toolkit.get_fundamentals_openai),
                     # offline tools
-                    self.toolkit.get_finnhub_company_insider_sentiment,
-                    self.toolkit.get_finnhub_company_insider_transactions,
-                    self.toolkit.get_simfin_balance_sheet,
-                    self.toolkit.get_simfin_cashflow,
-                    self.toolkit.get_simfin_income_stmt,
-                ]
+                    tool(self.toolkit.get_finnhub_company_insider_sentiment),
+                    tool(self.toolkit.get_finnhub_company_insider_transactions),
+                    tool(self.toolkit.get_simfin_balance_sheet),
+                    tool(self.toolkit.get_simfin_cashflow),
+                    tool(self.toolkit.get_simfin_income_stmt),
+                ],
+                messages_key=ANALYST_MESSAGE_KEYS["fundamentals"],
             ),
         }
 
@@ -180,6 +215,7 @@ class TradingAgentsGraph:
         """Run the trading agents graph for a company on a specific date."""
 
         self.ticker = company_name
+        cache_stats_before = get_cache_stats()
 
         # Initialize state
         init_agent_state = self.propagator.create_initial_state(
@@ -190,12 +226,11 @@ class TradingAgentsGraph:
         if self.debug:
             # Debug mode with tracing
             trace = []
+            seen = {}
             for chunk in self.graph.stream(init_agent_state, **args):
-                if len(chunk["messages"]) == 0:
-                    pass
-                else:
-                    chunk["messages"][-1].pretty_print()
-                    trace.append(chunk)
+                for message in self.propagator.get_new_messages(chunk, seen):
+                    message.pretty_print()
+                trace.append(chunk)
 
             final_state = trace[-1]
         else:
@@ -205,15 +240,143 @@ class TradingAgentsGraph:
         # Store current state for reflection
         self.curr_state = final_state
 
-        # Log state
-        self._log_state(trade_date, final_state)
+        # Log state, with the result cache hits and misses during the run
+        cache_stats = cache_stats_delta(cache_stats_before, get_cache_stats())
+        self._log_state(trade_date, final_state, cache_stats)
 
         # Return decision and processed signal
         return final_state, self.process_signal(final_state["final_trade_decision"])
 
-    def _log_state(self, trade_date, final_state):
+    async def apropagate(self, company_name, trade_date):
+        """Run the trading agents graph for a company on a specific date, asynchronously.
+
+        LLM calls are awaited and tool calls run on the tool pool, so one event
+        loop can drive many analyses at once. Like the runs of propagate_batch,
+        each call starts from its own initial state and writes its own state
+        log, so concurrent calls on one graph don't mix; curr_state is not
+        updated, pass the returned state to reflect_and_remember instead.
+        """
+        cache_stats_before = get_cache_stats()
+
+        # Initialize state
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        args = self.propagator.get_graph_args()
+
+        if self.debug:
+            # Debug mode with tracing
+            trace = []
+            seen = {}
+            async for chunk in self.graph.astream(init_agent_state, **args):
+                for message in self.propagator.get_new_messages(chunk, seen):
+                    message.pretty_print()
+                trace.append(chunk)
+
+            final_state = trace[-1]
+        else:
+            # Standard mode without tracing
+            final_state = await self.graph.ainvoke(init_agent_state, **args)
+
+        # Log state, with the result cache hits and misses during the run
+        cache_stats = cache_stats_delta(cache_stats_before, get_cache_stats())
+        self._write_state_log(
+            company_name,
+            trade_date,
+            {str(trade_date): self._state_log_entry(final_state, cache_stats)},
+        )
+
+        # Return decision and processed signal
+        signal = await self.signal_processor.aprocess_signal(
+            final_state["final_trade_decision"]
+        )
+        return final_state, signal
+
+    def propagate_batch(self, tickers, dates, max_concurrency=4):
+        """Run the trading agents graph for every ticker on every date concurrently.
+
+        Args:
+            tickers: Companies to analyse
+            dates: Trade date, or list of trade dates, to analyse each ticker on
+            max_concurrency: Maximum number of analyses running at once
+
+        Runs share the graph, tool pool and data caches, but each starts from
+        its own initial state and writes its own state log; curr_state is not
+        updated. Returns the runs in (date, ticker) order, each with its
+        decision, final state, wall-clock seconds and error (None if it
+        succeeded), plus the batch's aggregate timing and result cache hits and
+        misses. A run's logged cache stats count every lookup made while it
+        ran, including those of runs overlapping it.
+        """
+        if isinstance(dates, (str, date)):
+            dates = [dates]
+        jobs = [(ticker, trade_date) for trade_date in dates for ticker in tickers]
+
+        start = time.perf_counter()
+        cache_stats_before = get_cache_stats()
+        with ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="propagate"
+        ) as executor:
+            runs = list(executor.map(lambda job: self._propagate_isolated(*job), jobs))
+        wall_seconds = time.perf_counter() - start
+
+        run_seconds = [run["seconds"] for run in runs]
+        return {
+            "runs": runs,
+            "wall_seconds": wall_seconds,
+            "total_run_seconds": sum(run_seconds),
+            "max_run_seconds": max(run_seconds, default=0.0),
+            "failed": sum(run["error"] is not None for run in runs),
+            "cache_stats": cache_stats_delta(cache_stats_before, get_cache_stats()),
+        }
+
+    def _propagate_isolated(self, company_name, trade_date):
+        """One run of propagate_batch, touching no state shared between runs."""
+        start = time.perf_counter()
+        final_state, decision, error = None, None, None
+        cache_stats_before = get_cache_stats()
+        try:
+            init_agent_state = self.propagator.create_initial_state(
+                company_name, trade_date
+            )
+            final_state = self.graph.invoke(
+                init_agent_state, **self.propagator.get_graph_args()
+            )
+            cache_stats = cache_stats_delta(cache_stats_before, get_cache_stats())
+            self._write_state_log(
+                company_name,
+                trade_date,
+                {str(trade_date): self._state_log_entry(final_state, cache_stats)},
+            )
+            decision = self.process_signal(final_state["final_trade_decision"])
+        except Exception as e:
+            print(f"Error analysing {company_name} on {trade_date}: {e}")
+            error = str(e)
+
+        return {
+            "ticker": company_name,
+            "trade_date": str(trade_date),
+            "decision": decision,
+            "final_state": final_state,
+            "seconds": time.perf_counter() - start,
+            "error": error,
+        }
+
+    def _log_state(self, trade_date, final_state, cache_stats=None):
         """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        self.log_states_dict[str(trade_date)] = self._state_log_entry(
+            final_state, cache_stats
+        )
+
+        # Save to file
+        # (the state's company, since concurrent runs overwrite self.ticker)
+        self._write_state_log(
+            final_state["company_of_interest"], trade_date, self.log_states_dict
+        )
+
+    def _state_log_entry(self, final_state, cache_stats=None):
+        """The parts of a final state that are logged, with the run's cache stats."""
+        return {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -241,34 +404,39 @@ class TradingAgentsGraph:
             },
             "investment_plan": final_state["investment_plan"],
             "final_trade_decision": final_state["final_trade_decision"],
+            "cache_stats": cache_stats or {},
         }
 
-        # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
+    def _write_state_log(self, ticker, trade_date, log_states):
+        directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
         directory.mkdir(parents=True, exist_ok=True)
 
         with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
+            f"eval_results/{ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
             "w",
         ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+            json.dump(log_states, f, indent=4)
+
+    def reflect_and_remember(self, returns_losses, final_state=None):
+        """Reflect on decisions and update memory based on returns.
 
-    def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
+        Reflects on `final_state`, by default the state of the last propagate.
+        """
+        final_state = final_state or self.curr_state
         self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
+            final_state, returns_losses, self.bull_memory
         )
         self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
+            final_state, returns_losses, self.bear_memory
         )
         self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
+            final_state, returns_losses, self.trader_memory
         )
         self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
+            final_state, returns_losses, self.invest_judge_memory
         )
         self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+            final_state, returns_losses, self.risk_manager_memory
         )
 
     def process_signal(self, full_signal):